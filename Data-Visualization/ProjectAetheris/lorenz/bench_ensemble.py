@@ -0,0 +1,71 @@
+"""
+Cost per timestep of ensemble integration versus scalar runs, plus a Lyapunov estimate.
+
+Times one step of iter_ensemble for growing ensemble sizes and compares it
+with one step of a single scalar trajectory (the original per-element loop
+and the engine's pure-Python Euler kernel). Then estimates the largest
+Lyapunov exponent of the classic system across the whole ensemble.
+
+Run from the lorenz directory:
+    python bench_ensemble.py
+    python bench_ensemble.py --sizes 1 1000 10000 100000 --steps 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from bench_integrators import original_euler
+from lorenz_engine import integrate
+from lorenz_ensemble import (ENSEMBLE_METHODS, divergence, integrate_ensemble, iter_ensemble,
+                             lyapunov_exponents, perturbed_ensemble)
+
+
+def seconds_per_step(fn, num_steps):
+    """
+    Wall-clock seconds per step of fn(num_steps).
+    """
+    t0 = time.perf_counter()
+    fn(num_steps)
+    return (time.perf_counter() - t0) / num_steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 1000, 10000])
+    parser.add_argument('--steps', type=int, default=1000, help="Steps timed per case")
+    parser.add_argument('--lyapunov-members', type=int, default=1000)
+    args = parser.parse_args()
+
+    original = seconds_per_step(lambda n: original_euler(n, 0.01), args.steps)
+    scalar = seconds_per_step(lambda n: integrate(num_steps=n, jit=False), args.steps)
+    print(f"scalar euler, original loop: {original * 1e6:8.2f} us/step")
+    print(f"scalar euler, engine kernel: {scalar * 1e6:8.2f} us/step")
+    print()
+    print(f"{'method':<6} {'members':>8} {'us/step':>10} {'ns/member-step':>15} {'original runs':>14}")
+    for method in ENSEMBLE_METHODS:
+        for size in args.sizes:
+            states = perturbed_ensemble(size=size, seed=0)
+
+            def run(num_steps):
+                for _ in iter_ensemble(states, num_steps, method=method, every=num_steps):
+                    pass
+
+            per_step = seconds_per_step(run, args.steps)
+            # How many original scalar runs cost as much per step as this whole ensemble
+            print(f"{method:<6} {size:>8} {per_step * 1e6:>10.2f} {per_step / size * 1e9:>15.2f} "
+                  f"{per_step / original:>14.1f}")
+
+    states = perturbed_ensemble(size=args.lyapunov_members, scale=1e-6, seed=0)
+    spread = divergence(integrate_ensemble(states, 2500, method='rk4', every=500))
+    print()
+    print("median distance from the unperturbed run, t = 0, 5, ..., 25:")
+    print("  " + "  ".join(f"{d:.2e}" for d in np.median(spread[:, 1:], axis=1)))
+    t0 = time.perf_counter()
+    exponents = lyapunov_exponents(states, 20000, transient_steps=2000, seed=0)
+    print(f"largest Lyapunov exponent over {len(exponents)} members: "
+          f"{exponents.mean():.3f} +/- {exponents.std():.3f} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
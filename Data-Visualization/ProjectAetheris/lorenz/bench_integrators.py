@@ -0,0 +1,98 @@
+"""
+Compare Lorenz integrators: speed (steps per second) and accuracy per unit of CPU time.
+
+Every run integrates the classic system from the lorenz_chaos.py initial
+state up to --t-end and is scored by its endpoint error against a reference
+solution (RK4 with a very small step). The horizon is kept short because
+chaos amplifies any error exponentially. "original" is the per-element
+NumPy Euler loop lorenz_chaos.py used before the engine existed.
+
+Run from the lorenz directory:
+    python bench_integrators.py
+    python bench_integrators.py --t-end 10 --no-jit
+"""
+import argparse
+import time
+
+import numpy as np
+
+from lorenz_engine import JIT_AVAILABLE, integrate, integrate_adaptive, lorenz
+
+INITIAL_STATE = (0., 1., 1.05)
+
+
+def original_euler(num_steps, dt):
+    """
+    The Euler loop from the original lorenz_chaos.py script.
+    """
+    xs = np.empty(num_steps + 1)
+    ys = np.empty(num_steps + 1)
+    zs = np.empty(num_steps + 1)
+    xs[0], ys[0], zs[0] = INITIAL_STATE
+    for i in range(num_steps):
+        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i])
+        xs[i + 1] = xs[i] + (x_dot * dt)
+        ys[i + 1] = ys[i] + (y_dot * dt)
+        zs[i + 1] = zs[i] + (z_dot * dt)
+    return np.array([xs[-1], ys[-1], zs[-1]])
+
+
+def cpu_time(fn, repeats):
+    """
+    Return (CPU seconds, result) of the fastest of repeats calls to fn.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.process_time()
+        result = fn()
+        best = min(best, time.process_time() - t0)
+    return best, result
+
+
+def runs(t_end, jit):
+    """
+    Yield (method, setting, steps, fn) for each configuration; fn returns the endpoint.
+    """
+    for num_steps in (1000, 10000, 100000):
+        dt = t_end / num_steps
+        if num_steps <= 10000:
+            yield 'original', f'dt={dt:g}', num_steps, lambda n=num_steps, dt=dt: original_euler(n, dt)
+        yield 'euler', f'dt={dt:g}', num_steps, \
+            lambda n=num_steps, dt=dt: integrate(INITIAL_STATE, n, dt, jit=jit)[-1]
+    for num_steps in (250, 1000, 10000):
+        dt = t_end / num_steps
+        yield 'rk4', f'dt={dt:g}', num_steps, \
+            lambda n=num_steps, dt=dt: integrate(INITIAL_STATE, n, dt, jit=jit, method='rk4')[-1]
+    for rtol in (1e-4, 1e-6, 1e-8, 1e-10):
+        def adaptive(rtol=rtol):
+            times, trajectory = integrate_adaptive(INITIAL_STATE, t_end, rtol=rtol, atol=rtol * 1e-3, jit=jit)
+            adaptive.steps = len(times) - 1
+            return trajectory[-1]
+        yield 'dopri5', f'rtol={rtol:g}', None, adaptive
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--t-end', type=float, default=5.0, help="Integration horizon (default 5)")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--no-jit', action='store_true', help="Use the pure-Python kernels even if numba is installed")
+    args = parser.parse_args()
+    jit = JIT_AVAILABLE and not args.no_jit
+
+    reference = integrate(INITIAL_STATE, 400000, args.t_end / 400000, jit=jit, method='rk4')[-1]
+    print(f"Kernels: {'numba' if jit else 'pure Python'}; horizon t = {args.t_end:g}")
+    print(f"{'method':<9} {'setting':<14} {'steps':>8} {'cpu s':>9} {'steps/s':>12} {'error':>10} {'digits/ms':>10}")
+    for method, setting, steps, fn in runs(args.t_end, jit):
+        fn()  # warm up: numba compiles on first call
+        seconds, endpoint = cpu_time(fn, args.repeats)
+        steps = steps if steps is not None else fn.steps
+        error = float(np.abs(endpoint - reference).max())
+        # Correct significant digits at the endpoint, per millisecond of CPU
+        digits = max(0.0, -np.log10(max(error, 1e-16) / np.abs(reference).max()))
+        rate = f"{steps / seconds:>12.0f}" if seconds else f"{'-':>12}"
+        per_ms = f"{digits / (seconds * 1e3):>10.2f}" if seconds else f"{'-':>10}"
+        print(f"{method:<9} {setting:<14} {steps:>8} {seconds:>9.4f} {rate} {error:>10.2e} {per_ms}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,84 +1,98 @@
-import numpy as np
+import argparse
+
 import matplotlib.pyplot as plt
 # Note: mpl_toolkits.mplot3d is required for projection='3d'
 # It's typically included with matplotlib installations.
 from mpl_toolkits.mplot3d import Axes3D
 
-# --- Lorenz System Definition ---
-def lorenz(x, y, z, s=10, r=28, b=8/3):
-    """
-    Calculate the time derivatives of the Lorenz system.
-
-    Args:
-        x, y, z: Current state variables.
-        s, r, b: System parameters (sigma, rho, beta). Default values
-                 are the classic ones known to produce chaotic behavior.
-
-    Returns:
-        Tuple containing (dx/dt, dy/dt, dz/dt).
-    """
-    x_dot = s * (y - x)
-    y_dot = r * x - y - x * z
-    z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+from lorenz_engine import FIXED_STEP_METHODS, JIT_AVAILABLE, integrate, integrate_adaptive
+from lorenz_storage import decimate, save_trajectory
 
 # --- Simulation Parameters ---
-dt = 0.01  # Time step for numerical integration
-num_steps = 10000  # Number of steps to simulate
+DT = 0.01  # Time step for numerical integration
+NUM_STEPS = 10000  # Number of steps to simulate
+MAX_PLOT_POINTS = 200000  # Longer runs are thinned to this many points for plotting
 
 # --- Initial Conditions ---
 # Small changes in initial conditions lead to vastly different trajectories (Butterfly Effect)
-x0, y0, z0 = (0., 1., 1.05)
-
-# --- Simulation ---
-# Initialize arrays to store the trajectory
-xs = np.empty(num_steps + 1)
-ys = np.empty(num_steps + 1)
-zs = np.empty(num_steps + 1)
-
-# Set the initial state
-xs[0], ys[0], zs[0] = (x0, y0, z0)
-
-# Perform numerical integration using the simple Euler method
-print(f"Simulating Lorenz system for {num_steps} steps with dt={dt}...")
-for i in range(num_steps):
-    # Get derivatives at the current state
-    x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i])
-    # Update state using Euler method: state_new = state_old + derivative * dt
-    xs[i + 1] = xs[i] + (x_dot * dt)
-    ys[i + 1] = ys[i] + (y_dot * dt)
-    zs[i + 1] = zs[i] + (z_dot * dt)
-print("Simulation complete.")
-
-# --- Visualization ---
-print("Generating 3D plot...")
-fig = plt.figure(figsize=(12, 9))
-ax = fig.add_subplot(111, projection='3d')
-
-# Plot the trajectory
-ax.plot(xs, ys, zs, lw=0.7, color='magenta') # Use a thinner line for clarity
-
-# Add starting point marker
-ax.scatter(xs[0], ys[0], zs[0], color='green', marker='o', s=60, label='Start Point')
-
-# Improve plot aesthetics
-ax.set_xlabel("X Axis")
-ax.set_ylabel("Y Axis")
-ax.set_zlabel("Z Axis")
-ax.set_title("Lorenz Attractor: Visualizing Deterministic Chaos")
-ax.legend()
-ax.grid(True)
-
-# Provide context
-print("\n--- Lorenz Attractor Simulation ---")
-print("This simulation demonstrates the Lorenz system, a classic example of deterministic chaos.")
-print("Observe the intricate 'butterfly' pattern traced by the system's state over time.")
-print("Key takeaway: Simple, deterministic rules (the Lorenz equations) can lead to complex,")
-print("non-repeating, and highly sensitive behavior (chaos). A tiny change in the starting")
-print("point would result in a completely different trajectory over time - the 'Butterfly Effect'.")
-print("This discovery fundamentally changed our understanding of predictability in fields like")
-print("weather forecasting, physics, biology, and economics.")
-
-plt.show()
-
-print("\nPlot displayed. Close the plot window to exit.")
+INITIAL_STATE = (0., 1., 1.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate and plot the Lorenz attractor.")
+    parser.add_argument('--steps', type=int, default=NUM_STEPS, help="Number of steps to simulate")
+    parser.add_argument('--dt', type=float, default=DT, help="Time step for numerical integration")
+    parser.add_argument(
+        '--method', choices=[*FIXED_STEP_METHODS, 'dopri5'], default='euler',
+        help="Integrator: fixed-step euler (default) or rk4, or adaptive dopri5 up to t = steps * dt"
+    )
+    parser.add_argument('--rtol', type=float, default=1e-6, help="Relative tolerance for dopri5")
+    parser.add_argument(
+        '--save', metavar='FILE.npy',
+        help="Integrate in chunks straight into a memory-mapped .npy file (euler/rk4), for runs larger than RAM"
+    )
+    parser.add_argument('--no-plot', action='store_true', help="Only run the simulation")
+    args = parser.parse_args()
+    if args.save and args.method == 'dopri5':
+        parser.error("--save needs a fixed-step method (euler or rk4)")
+    num_steps, dt = args.steps, args.dt
+
+    # --- Simulation ---
+    kernel = "numba" if JIT_AVAILABLE else "pure Python"
+    if args.method == 'dopri5':
+        # Adaptive Dormand-Prince: the step size follows the error tolerance
+        t_end = num_steps * dt
+        print(f"Simulating Lorenz system to t={t_end:g} with dopri5, rtol={args.rtol} ({kernel} kernel)...")
+        times, trajectory = integrate_adaptive(INITIAL_STATE, t_end, rtol=args.rtol, atol=args.rtol * 1e-3)
+        print(f"Simulation complete: {len(times) - 1} accepted steps.")
+    elif args.save:
+        # Chunked integration into a memory-mapped file; nothing is held in RAM
+        print(f"Simulating Lorenz system for {num_steps} steps with dt={dt} using {args.method} "
+              f"({kernel} kernel) into {args.save}...")
+        trajectory = save_trajectory(args.save, INITIAL_STATE, num_steps, dt, method=args.method)
+        print("Simulation complete.")
+    else:
+        # Fixed-step integration (Euler, as originally, or RK4)
+        print(f"Simulating Lorenz system for {num_steps} steps with dt={dt} using {args.method} ({kernel} kernel)...")
+        trajectory = integrate(INITIAL_STATE, num_steps, dt, method=args.method)
+        print("Simulation complete.")
+    if args.no_plot:
+        return
+    xs, ys, zs = decimate(trajectory, MAX_PLOT_POINTS).T
+
+    # --- Visualization ---
+    print("Generating 3D plot...")
+    fig = plt.figure(figsize=(12, 9))
+    ax = fig.add_subplot(111, projection='3d')
+
+    # Plot the trajectory
+    ax.plot(xs, ys, zs, lw=0.7, color='magenta') # Use a thinner line for clarity
+
+    # Add starting point marker
+    ax.scatter(xs[0], ys[0], zs[0], color='green', marker='o', s=60, label='Start Point')
+
+    # Improve plot aesthetics
+    ax.set_xlabel("X Axis")
+    ax.set_ylabel("Y Axis")
+    ax.set_zlabel("Z Axis")
+    ax.set_title("Lorenz Attractor: Visualizing Deterministic Chaos")
+    ax.legend()
+    ax.grid(True)
+
+    # Provide context
+    print("\n--- Lorenz Attractor Simulation ---")
+    print("This simulation demonstrates the Lorenz system, a classic example of deterministic chaos.")
+    print("Observe the intricate 'butterfly' pattern traced by the system's state over time.")
+    print("Key takeaway: Simple, deterministic rules (the Lorenz equations) can lead to complex,")
+    print("non-repeating, and highly sensitive behavior (chaos). A tiny change in the starting")
+    print("point would result in a completely different trajectory over time - the 'Butterfly Effect'.")
+    print("This discovery fundamentally changed our understanding of predictability in fields like")
+    print("weather forecasting, physics, biology, and economics.")
+
+    plt.show()
+
+    print("\nPlot displayed. Close the plot window to exit.")
+
+
+if __name__ == '__main__':
+    main()
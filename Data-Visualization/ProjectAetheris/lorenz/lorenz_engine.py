@@ -0,0 +1,311 @@
+"""
+Integration engine for the Lorenz system.
+
+Importable without plotting: lorenz_chaos.py (and any analysis script) calls
+integrate() to get a trajectory as a NumPy array of shape (num_steps + 1, 3).
+
+Integrators:
+    euler   - fixed-step forward Euler, as in the original script
+    rk4     - fixed-step classic fourth-order Runge-Kutta
+    dopri5  - adaptive Dormand-Prince 5(4) with error control (integrate_adaptive)
+
+The Euler kernel has the lorenz() derivative inlined. It is compiled with
+numba when that optional package is installed, and otherwise runs as a tight
+pure-Python loop over plain floats (no per-step NumPy indexing). Both paths
+perform the same floating-point operations in the same order as lorenz(), so
+their trajectories match the original script step for step. The RK4 and
+Dormand-Prince kernels are compiled the same way when numba is available.
+"""
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the pure-Python kernel
+    njit = None
+
+# Classic parameters (sigma, rho, beta) known to produce chaotic behavior
+SIGMA = 10.0
+RHO = 28.0
+BETA = 8 / 3
+
+JIT_AVAILABLE = njit is not None
+
+# Dormand-Prince 5(4) tableau: stage nodes, stage weights, fifth-order weights
+# (also the last stage, so it is reused as the next step's first: FSAL) and
+# the fifth minus fourth order weights used for the error estimate
+DP_C2, DP_C3, DP_C4, DP_C5 = 1 / 5, 3 / 10, 4 / 5, 8 / 9
+DP_A21 = 1 / 5
+DP_A31, DP_A32 = 3 / 40, 9 / 40
+DP_A41, DP_A42, DP_A43 = 44 / 45, -56 / 15, 32 / 9
+DP_A51, DP_A52, DP_A53, DP_A54 = 19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729
+DP_A61, DP_A62, DP_A63, DP_A64, DP_A65 = 9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656
+DP_B1, DP_B3, DP_B4, DP_B5, DP_B6 = 35 / 384, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84
+DP_E1, DP_E3, DP_E4, DP_E5, DP_E6, DP_E7 = (71 / 57600, -71 / 16695, 71 / 1920,
+                                            -17253 / 339200, 22 / 525, -1 / 40)
+
+
+def lorenz(x, y, z, s=SIGMA, r=RHO, b=BETA):
+    """
+    Calculate the time derivatives of the Lorenz system.
+
+    Args:
+        x, y, z: Current state variables (floats or NumPy arrays).
+        s, r, b: System parameters (sigma, rho, beta). Default values
+                 are the classic ones known to produce chaotic behavior.
+
+    Returns:
+        Tuple containing (dx/dt, dy/dt, dz/dt).
+    """
+    x_dot = s * (y - x)
+    y_dot = r * x - y - x * z
+    z_dot = x * y - b * z
+    return x_dot, y_dot, z_dot
+
+
+def _euler_fill(out, x, y, z, dt, s, r, b):
+    """
+    Write num_steps Euler steps after (x, y, z) into out, shape (num_steps, 3).
+    Compiled by numba when available.
+    """
+    for i in range(out.shape[0]):
+        x, y, z = (x + s * (y - x) * dt,
+                   y + (r * x - y - x * z) * dt,
+                   z + (x * y - b * z) * dt)
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = z
+    return out
+
+
+def _euler_python(num_steps, x, y, z, dt, s, r, b):
+    """
+    Pure-Python Euler kernel. Returns num_steps states after (x, y, z) as an
+    array of shape (num_steps, 3).
+    """
+    # array('d') stores raw doubles, avoiding a float object per value
+    buffer = array('d')
+    extend = buffer.extend
+    for _ in range(num_steps):
+        x, y, z = (x + s * (y - x) * dt,
+                   y + (r * x - y - x * z) * dt,
+                   z + (x * y - b * z) * dt)
+        extend((x, y, z))
+    return np.frombuffer(buffer, dtype=np.float64).reshape(num_steps, 3)
+
+
+def _make_rk4_fill(derivative):
+    """
+    Build an RK4 kernel around derivative (lorenz, or its numba-compiled form).
+    The kernel writes out.shape[0] steps after (x, y, z) into out.
+    """
+    def rk4_fill(out, x, y, z, dt, s, r, b):
+        half = 0.5 * dt
+        sixth = dt / 6.0
+        for i in range(out.shape[0]):
+            k1x, k1y, k1z = derivative(x, y, z, s, r, b)
+            k2x, k2y, k2z = derivative(x + half * k1x, y + half * k1y, z + half * k1z, s, r, b)
+            k3x, k3y, k3z = derivative(x + half * k2x, y + half * k2y, z + half * k2z, s, r, b)
+            k4x, k4y, k4z = derivative(x + dt * k3x, y + dt * k3y, z + dt * k3z, s, r, b)
+            x += sixth * (k1x + 2.0 * k2x + 2.0 * k3x + k4x)
+            y += sixth * (k1y + 2.0 * k2y + 2.0 * k3y + k4y)
+            z += sixth * (k1z + 2.0 * k2z + 2.0 * k3z + k4z)
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
+        return out
+    return rk4_fill
+
+
+def _make_dopri5(derivative):
+    """
+    Build an adaptive Dormand-Prince 5(4) kernel around derivative.
+    The kernel integrates from t = 0 to t_end and returns the lists
+    (times, xs, ys, zs) of every accepted step, starting with the initial state.
+    """
+    def dopri5(x, y, z, t_end, h, rtol, atol, s, r, b, max_steps):
+        times, xs, ys, zs = [0.0], [x], [y], [z]
+        t = 0.0
+        k1x, k1y, k1z = derivative(x, y, z, s, r, b)
+        steps = 0
+        while t < t_end:
+            if steps >= max_steps:
+                raise RuntimeError("dopri5 exceeded max_steps before reaching t_end")
+            if t + h > t_end:
+                h = t_end - t
+            k2x, k2y, k2z = derivative(x + h * DP_A21 * k1x,
+                                       y + h * DP_A21 * k1y,
+                                       z + h * DP_A21 * k1z, s, r, b)
+            k3x, k3y, k3z = derivative(x + h * (DP_A31 * k1x + DP_A32 * k2x),
+                                       y + h * (DP_A31 * k1y + DP_A32 * k2y),
+                                       z + h * (DP_A31 * k1z + DP_A32 * k2z), s, r, b)
+            k4x, k4y, k4z = derivative(x + h * (DP_A41 * k1x + DP_A42 * k2x + DP_A43 * k3x),
+                                       y + h * (DP_A41 * k1y + DP_A42 * k2y + DP_A43 * k3y),
+                                       z + h * (DP_A41 * k1z + DP_A42 * k2z + DP_A43 * k3z), s, r, b)
+            k5x, k5y, k5z = derivative(x + h * (DP_A51 * k1x + DP_A52 * k2x + DP_A53 * k3x + DP_A54 * k4x),
+                                       y + h * (DP_A51 * k1y + DP_A52 * k2y + DP_A53 * k3y + DP_A54 * k4y),
+                                       z + h * (DP_A51 * k1z + DP_A52 * k2z + DP_A53 * k3z + DP_A54 * k4z),
+                                       s, r, b)
+            k6x, k6y, k6z = derivative(
+                x + h * (DP_A61 * k1x + DP_A62 * k2x + DP_A63 * k3x + DP_A64 * k4x + DP_A65 * k5x),
+                y + h * (DP_A61 * k1y + DP_A62 * k2y + DP_A63 * k3y + DP_A64 * k4y + DP_A65 * k5y),
+                z + h * (DP_A61 * k1z + DP_A62 * k2z + DP_A63 * k3z + DP_A64 * k4z + DP_A65 * k5z),
+                s, r, b)
+            nx = x + h * (DP_B1 * k1x + DP_B3 * k3x + DP_B4 * k4x + DP_B5 * k5x + DP_B6 * k6x)
+            ny = y + h * (DP_B1 * k1y + DP_B3 * k3y + DP_B4 * k4y + DP_B5 * k5y + DP_B6 * k6y)
+            nz = z + h * (DP_B1 * k1z + DP_B3 * k3z + DP_B4 * k4z + DP_B5 * k5z + DP_B6 * k6z)
+            k7x, k7y, k7z = derivative(nx, ny, nz, s, r, b)
+
+            # Error estimate scaled per component, RMS norm; accept when <= 1
+            ex = h * (DP_E1 * k1x + DP_E3 * k3x + DP_E4 * k4x + DP_E5 * k5x + DP_E6 * k6x + DP_E7 * k7x)
+            ey = h * (DP_E1 * k1y + DP_E3 * k3y + DP_E4 * k4y + DP_E5 * k5y + DP_E6 * k6y + DP_E7 * k7y)
+            ez = h * (DP_E1 * k1z + DP_E3 * k3z + DP_E4 * k4z + DP_E5 * k5z + DP_E6 * k6z + DP_E7 * k7z)
+            ex /= atol + rtol * max(abs(x), abs(nx))
+            ey /= atol + rtol * max(abs(y), abs(ny))
+            ez /= atol + rtol * max(abs(z), abs(nz))
+            error = ((ex * ex + ey * ey + ez * ez) / 3.0) ** 0.5
+
+            steps += 1
+            if error <= 1.0:
+                t += h
+                x, y, z = nx, ny, nz
+                k1x, k1y, k1z = k7x, k7y, k7z
+                times.append(t)
+                xs.append(x)
+                ys.append(y)
+                zs.append(z)
+            # Standard controller: safety factor 0.9, growth limited to [0.2, 5]
+            factor = 5.0 if error == 0.0 else 0.9 * error ** -0.2
+            h *= min(5.0, max(0.2, factor))
+        return times, xs, ys, zs
+    return dopri5
+
+
+_euler_jit = njit(cache=True)(_euler_fill) if JIT_AVAILABLE else None
+_rk4_python = _make_rk4_fill(lorenz)
+_rk4_jit = njit(_make_rk4_fill(njit(lorenz))) if JIT_AVAILABLE else None
+_dopri5_python = _make_dopri5(lorenz)
+_dopri5_jit = njit(_make_dopri5(njit(lorenz))) if JIT_AVAILABLE else None
+
+
+def _use_jit(jit):
+    """
+    Resolve a jit argument: None means use numba whenever it is installed.
+    """
+    if jit is None:
+        return JIT_AVAILABLE
+    if jit and not JIT_AVAILABLE:
+        raise RuntimeError("jit=True requires numba (pip install numba)")
+    return jit
+
+
+def euler_steps(state, num_steps, dt=0.01, s=SIGMA, r=RHO, b=BETA, jit=None, out=None):
+    """
+    Advance one trajectory with forward Euler.
+
+    Args:
+        state: Starting point (x, y, z).
+        num_steps: Number of steps to take.
+        dt: Time step.
+        s, r, b: System parameters (sigma, rho, beta).
+        jit: Use the numba kernel. None picks it whenever numba is installed.
+        out: Optional float64 array of shape (num_steps, 3) to write into.
+
+    Returns:
+        Array of shape (num_steps, 3) holding the states after each step
+        (the starting point itself is not included); out if it was given.
+    """
+    jit = _use_jit(jit)
+    x, y, z = (float(v) for v in state)
+    dt, s, r, b = float(dt), float(s), float(r), float(b)
+    if jit:
+        return _euler_jit(np.empty((num_steps, 3)) if out is None else out, x, y, z, dt, s, r, b)
+    steps = _euler_python(num_steps, x, y, z, dt, s, r, b)
+    if out is None:
+        return steps
+    out[:] = steps
+    return out
+
+
+def rk4_steps(state, num_steps, dt=0.01, s=SIGMA, r=RHO, b=BETA, jit=None, out=None):
+    """
+    Advance one trajectory with classic fourth-order Runge-Kutta.
+
+    Args:
+        state: Starting point (x, y, z).
+        num_steps: Number of steps to take.
+        dt: Time step.
+        s, r, b: System parameters (sigma, rho, beta).
+        jit: Use the numba kernel. None picks it whenever numba is installed.
+        out: Optional float64 array of shape (num_steps, 3) to write into.
+
+    Returns:
+        Array of shape (num_steps, 3) holding the states after each step
+        (the starting point itself is not included); out if it was given.
+    """
+    kernel = _rk4_jit if _use_jit(jit) else _rk4_python
+    x, y, z = (float(v) for v in state)
+    if out is None:
+        out = np.empty((num_steps, 3))
+    return kernel(out, x, y, z, float(dt), float(s), float(r), float(b))
+
+
+# Fixed-step integrators by name, all with the euler_steps signature
+FIXED_STEP_METHODS = {
+    'euler': euler_steps,
+    'rk4': rk4_steps,
+}
+
+
+def integrate(initial=(0., 1., 1.05), num_steps=10000, dt=0.01, s=SIGMA, r=RHO, b=BETA, jit=None,
+              method='euler'):
+    """
+    Simulate the Lorenz system from an initial condition with a fixed step.
+
+    Args:
+        initial: Initial state (x0, y0, z0).
+        num_steps: Number of steps to simulate.
+        dt: Time step for numerical integration.
+        s, r, b: System parameters (sigma, rho, beta).
+        jit: Use the numba kernel. None picks it whenever numba is installed.
+        method: 'euler' or 'rk4'.
+
+    Returns:
+        Array of shape (num_steps + 1, 3); row 0 is the initial state and
+        the columns are x, y and z.
+    """
+    if method not in FIXED_STEP_METHODS:
+        raise ValueError(f"unknown method {method!r}; choose from {', '.join(FIXED_STEP_METHODS)}")
+    trajectory = np.empty((num_steps + 1, 3))
+    trajectory[0] = initial
+    FIXED_STEP_METHODS[method](initial, num_steps, dt, s, r, b, jit, out=trajectory[1:])
+    return trajectory
+
+
+def integrate_adaptive(initial=(0., 1., 1.05), t_end=100.0, rtol=1e-6, atol=1e-9, s=SIGMA, r=RHO, b=BETA,
+                       first_step=0.01, max_steps=10**8, jit=None):
+    """
+    Simulate the Lorenz system with the adaptive Dormand-Prince 5(4) method.
+
+    The step size is chosen so that the estimated local error of each step
+    stays below atol + rtol * |state| in every component.
+
+    Args:
+        initial: Initial state (x0, y0, z0).
+        t_end: Time to integrate up to.
+        rtol, atol: Relative and absolute error tolerances.
+        s, r, b: System parameters (sigma, rho, beta).
+        first_step: Initial step size guess.
+        max_steps: Limit on attempted steps, accepted or rejected.
+        jit: Use the numba kernel. None picks it whenever numba is installed.
+
+    Returns:
+        (times, trajectory): times of the accepted steps, shape (n,), starting
+        at 0 and ending at t_end, and the states at those times, shape (n, 3).
+    """
+    kernel = _dopri5_jit if _use_jit(jit) else _dopri5_python
+    x, y, z = (float(v) for v in initial)
+    times, xs, ys, zs = kernel(x, y, z, float(t_end), float(first_step), float(rtol), float(atol),
+                               float(s), float(r), float(b), int(max_steps))
+    return np.array(times), np.column_stack((xs, ys, zs))
@@ -0,0 +1,136 @@
+"""
+Chunked and on-disk trajectories for long Lorenz runs.
+
+A trajectory of num_steps steps is computed in fixed-size chunks, each
+starting from the last state of the previous one, so memory use depends on
+the chunk size rather than the run length. Chunks can be consumed as a
+stream (iter_trajectory) or written straight into a memory-mapped .npy
+file (save_trajectory) that NumPy, and load_trajectory / iter_chunks, can
+later read back lazily. Chunked runs are identical to a single integrate()
+call with the same arguments.
+"""
+import numpy as np
+
+from lorenz_engine import BETA, FIXED_STEP_METHODS, RHO, SIGMA
+
+# Steps per chunk: 1M steps is 24 MB of float64 states
+DEFAULT_CHUNK_STEPS = 1 << 20
+
+
+def _chunk_bounds(num_rows, chunk_steps):
+    """
+    Yield half-open (start, stop) row ranges covering rows 1 .. num_rows - 1
+    (row 0 is the initial state).
+    """
+    for start in range(1, num_rows, chunk_steps):
+        yield start, min(start + chunk_steps, num_rows)
+
+
+def _method(method):
+    if method not in FIXED_STEP_METHODS:
+        raise ValueError(f"unknown method {method!r}; choose from {', '.join(FIXED_STEP_METHODS)}")
+    return FIXED_STEP_METHODS[method]
+
+
+def iter_trajectory(initial=(0., 1., 1.05), num_steps=10000, dt=0.01, s=SIGMA, r=RHO, b=BETA, jit=None,
+                    method='euler', chunk_steps=DEFAULT_CHUNK_STEPS):
+    """
+    Simulate the Lorenz system, yielding the trajectory in consecutive chunks.
+
+    Args:
+        initial: Initial state (x0, y0, z0).
+        num_steps: Number of steps to simulate.
+        dt: Time step for numerical integration.
+        s, r, b: System parameters (sigma, rho, beta).
+        jit: Use the numba kernel. None picks it whenever numba is installed.
+        method: 'euler' or 'rk4'.
+        chunk_steps: Maximum rows per chunk.
+
+    Yields:
+        Arrays of shape (k, 3). The first is just the initial state (1, 3);
+        concatenated, they equal integrate(initial, num_steps, ...).
+    """
+    advance = _method(method)
+    state = np.array(initial, dtype=float).reshape(1, 3)
+    yield state
+    for start, stop in _chunk_bounds(num_steps + 1, chunk_steps):
+        state = advance(state[-1], stop - start, dt, s, r, b, jit)
+        yield state
+
+
+def save_trajectory(path, initial=(0., 1., 1.05), num_steps=10000, dt=0.01, s=SIGMA, r=RHO, b=BETA, jit=None,
+                    method='euler', chunk_steps=DEFAULT_CHUNK_STEPS):
+    """
+    Simulate the Lorenz system into a memory-mapped .npy file.
+
+    Each chunk is integrated directly into the mapped file, so runs far
+    larger than RAM only need disk space: 24 bytes per step.
+
+    Args:
+        path: Output .npy file, overwritten if it exists.
+        initial, num_steps, dt, s, r, b, jit, method, chunk_steps: As for iter_trajectory.
+
+    Returns:
+        The trajectory as a read-only memory map of shape (num_steps + 1, 3).
+    """
+    advance = _method(method)
+    # Write the .npy header and size the file, then map one chunk at a time so
+    # only the chunk being integrated is mapped and resident
+    header = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(num_steps + 1, 3))
+    offset = header.offset
+    header[0] = initial
+    header.flush()
+    del header
+    state = tuple(float(v) for v in initial)
+    row_bytes = 3 * np.dtype(np.float64).itemsize
+    for start, stop in _chunk_bounds(num_steps + 1, chunk_steps):
+        chunk = np.memmap(path, dtype=np.float64, mode='r+', offset=offset + start * row_bytes,
+                          shape=(stop - start, 3))
+        advance(state, stop - start, dt, s, r, b, jit, out=chunk)
+        state = tuple(chunk[-1])
+        chunk.flush()
+        del chunk
+    return load_trajectory(path)
+
+
+def load_trajectory(path):
+    """
+    Open a saved trajectory as a read-only memory map, shape (num_steps + 1, 3).
+    Nothing is read from disk until it is indexed.
+    """
+    return np.load(path, mmap_mode='r')
+
+
+def iter_chunks(path, chunk_steps=DEFAULT_CHUNK_STEPS):
+    """
+    Yield a saved trajectory in consecutive chunks of at most chunk_steps rows.
+    Chunks are read-only views of the memory map.
+    """
+    trajectory = load_trajectory(path)
+    for start in range(0, len(trajectory), chunk_steps):
+        yield trajectory[start:start + chunk_steps]
+
+
+def bounding_box(chunks):
+    """
+    Per-coordinate minimum and maximum over a stream of (k, 3) chunks.
+
+    Returns:
+        (lows, highs), two arrays of shape (3,).
+    """
+    lows = np.full(3, np.inf)
+    highs = np.full(3, -np.inf)
+    for chunk in chunks:
+        np.minimum(lows, chunk.min(axis=0), out=lows)
+        np.maximum(highs, chunk.max(axis=0), out=highs)
+    return lows, highs
+
+
+def decimate(trajectory, max_points):
+    """
+    Every k-th row of a trajectory, with k chosen so at most max_points rows
+    remain; for plotting runs too long to draw in full. On a memory map only
+    the kept rows are copied into memory.
+    """
+    stride = max(1, -(-len(trajectory) // max_points))
+    return np.array(trajectory[::stride])
@@ -0,0 +1,263 @@
+"""
+Parallel parameter sweep over (sigma, rho, beta) for the Lorenz system.
+
+A grid of parameter sets is split into chunks. Each chunk is integrated as
+one ensemble with per-member parameters (see lorenz_ensemble) inside a
+worker process, and every grid point is summarized by:
+
+    bounding box      x_min .. z_max over the post-transient trajectory
+    mean_z            time average of z
+    lyapunov          largest Lyapunov exponent (negative: stable)
+    fixed_point       'origin', 'C+' or 'C-' if the run settled onto that
+                      equilibrium, else empty
+    fixed_point_distance  final distance to the nearest equilibrium
+
+Rows are appended to a CSV file (one column per statistic) as soon as their
+chunk finishes, so partial results survive an interrupted sweep. CSV is used
+rather than a binary columnar format such as .npz because those can only be
+written once all rows are known; np.genfromtxt(path, delimiter=',',
+names=True, dtype=None, encoding=None) reads the file back column by column.
+
+Run from the lorenz directory:
+    python lorenz_sweep.py --rho 0 50 201 --output rho_sweep.csv
+    python lorenz_sweep.py --sigma 5 20 16 --rho 10 40 31 --beta 2.667 --workers 8 -o grid.csv
+"""
+import argparse
+import concurrent.futures
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+from lorenz_engine import BETA, RHO, SIGMA
+from lorenz_ensemble import lyapunov_exponents
+
+# Columns of the results file, in order
+COLUMNS = ('index', 'sigma', 'rho', 'beta',
+           'x_min', 'x_max', 'y_min', 'y_max', 'z_min', 'z_max',
+           'mean_z', 'lyapunov', 'fixed_point', 'fixed_point_distance')
+
+# A run counts as attracted to an equilibrium when it ends this close to it
+FIXED_POINT_TOLERANCE = 1e-3
+
+# Steps between Lyapunov renormalizations (see lyapunov_exponents)
+RENORMALIZE_EVERY = 10
+
+
+def parameter_grid(sigmas=(SIGMA,), rhos=(RHO,), betas=(BETA,)):
+    """
+    Every combination of the given parameter values.
+
+    Returns:
+        Array of shape (len(sigmas) * len(rhos) * len(betas), 3) whose rows
+        are (sigma, rho, beta); rho varies fastest.
+    """
+    sigma, beta, rho = np.meshgrid(sigmas, betas, rhos, indexing='ij')
+    return np.column_stack((sigma.ravel(), rho.ravel(), beta.ravel()))
+
+
+def fixed_points(rho, beta):
+    """
+    Equilibria of the Lorenz system for arrays of rho and beta.
+
+    Returns:
+        Array of shape (3, N, 3): the origin, C+ and C-. C+ and C- only exist
+        for rho > 1 and are NaN elsewhere.
+    """
+    rho = np.asarray(rho, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    with np.errstate(invalid='ignore'):
+        c = np.sqrt(beta * (rho - 1))
+    origin = np.zeros((len(rho), 3))
+    c_plus = np.column_stack((c, c, rho - 1))
+    c_minus = np.column_stack((-c, -c, rho - 1))
+    return np.stack((origin, c_plus, c_minus))
+
+
+def summarize_chunk(params, initial=(0., 1., 1.05), num_steps=20000, dt=0.01, transient_steps=5000,
+                    method='rk4', seed=0):
+    """
+    Integrate every parameter set of a chunk as one ensemble and summarize it.
+
+    Args:
+        params: Array of shape (N, 3) of (sigma, rho, beta) rows.
+        initial: Initial state shared by every run.
+        num_steps: Total steps per run, including the transient.
+        dt: Time step.
+        transient_steps: Steps discarded before collecting statistics.
+        method: 'euler' or 'rk4'.
+        seed: Seed for the Lyapunov shadow directions.
+
+    Returns:
+        Dict mapping each statistic column to an array of shape (N,).
+    """
+    params = np.asarray(params, dtype=float)
+    s, r, b = params.T
+    states = np.tile(np.asarray(initial, dtype=float), (len(params), 1))
+
+    # Statistics are gathered in (3, N) column layout, straight from the member
+    # half of the Lyapunov pass, so each chunk is integrated only once
+    lows = np.full((3, len(params)), np.inf)
+    highs = np.full((3, len(params)), -np.inf)
+    z_total = np.zeros(len(params))
+    samples = 0
+    final = states.T
+
+    def collect(step, members):
+        nonlocal samples, final
+        if step >= transient_steps:
+            np.minimum(lows, members, out=lows)
+            np.maximum(highs, members, out=highs)
+            np.add(z_total, members[2], out=z_total)
+            samples += 1
+        if step == num_steps:
+            final = members.copy()
+
+    # Runs that blow up (too large a step for their parameters) end up as inf/NaN
+    with np.errstate(over='ignore', invalid='ignore'):
+        lyapunov = lyapunov_exponents(states, num_steps, dt, s, r, b, method,
+                                      renormalize_every=RENORMALIZE_EVERY, transient_steps=transient_steps,
+                                      seed=seed, on_step=collect)
+        distances = np.linalg.norm(fixed_points(r, b) - final.T, axis=2)
+    nearest = np.argmin(np.where(np.isnan(distances), np.inf, distances), axis=0)
+    nearest_distance = distances[nearest, np.arange(len(params))]
+    labels = np.array(['origin', 'C+', 'C-'])[nearest]
+    labels[~(nearest_distance < FIXED_POINT_TOLERANCE)] = ''
+
+    return {
+        'sigma': s, 'rho': r, 'beta': b,
+        'x_min': lows[0], 'x_max': highs[0],
+        'y_min': lows[1], 'y_max': highs[1],
+        'z_min': lows[2], 'z_max': highs[2],
+        'mean_z': z_total / max(samples, 1),
+        'lyapunov': lyapunov,
+        'fixed_point': labels,
+        'fixed_point_distance': nearest_distance,
+    }
+
+
+def _sweep_task(first_index, params, options):
+    """
+    Worker entry point: summarize one chunk and return its rows.
+    """
+    stats = summarize_chunk(params, **options)
+    rows = []
+    for i in range(len(params)):
+        row = {column: stats[column][i] for column in COLUMNS[1:]}
+        row['index'] = first_index + i
+        rows.append(row)
+    return rows
+
+
+def iter_sweep(grid, workers=None, chunk_size=64, **options):
+    """
+    Summarize every parameter set of a grid across a process pool.
+
+    Args:
+        grid: Array of shape (M, 3) of (sigma, rho, beta) rows, e.g. from parameter_grid.
+        workers: Worker processes (default: one per CPU). 1 runs in this process.
+        chunk_size: Parameter sets integrated together as one ensemble per task.
+        options: Passed on to summarize_chunk (initial, num_steps, dt, ...).
+
+    Yields:
+        One dict per grid point, keyed by COLUMNS, in completion order
+        (use the 'index' column to restore grid order).
+    """
+    grid = np.asarray(grid, dtype=float)
+    workers = workers or os.cpu_count() or 1
+    chunks = ((i, grid[i:i + chunk_size]) for i in range(0, len(grid), chunk_size))
+
+    if workers == 1:
+        for first_index, params in chunks:
+            yield from _sweep_task(first_index, params, options)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        # Two chunks per worker keeps every process busy while the grid is
+        # submitted lazily; rows are handed on in whatever order chunks finish
+        pending = set()
+        try:
+            for first_index, params in chunks:
+                pending.add(ex.submit(_sweep_task, first_index, params, options))
+                while len(pending) >= 2 * workers:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            # Closing the generator early (e.g. on a write error) drops queued chunks
+            for future in pending:
+                future.cancel()
+
+
+def write_sweep(grid, output_path, workers=None, chunk_size=64, progress=False, **options):
+    """
+    Run a sweep and stream its rows to a CSV file as they complete.
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    t0 = time.perf_counter()
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in iter_sweep(grid, workers, chunk_size, **options):
+            writer.writerow(row)
+            count += 1
+            if count % chunk_size == 0 or count == len(grid):
+                f.flush()
+                if progress:
+                    elapsed = time.perf_counter() - t0
+                    print(f"{count}/{len(grid)} points, {count / elapsed:.1f} points/s", file=sys.stderr)
+    return count
+
+
+def _values(spec):
+    """
+    Parse a parameter spec: one value, or START STOP COUNT for an evenly spaced range.
+    """
+    if len(spec) == 1:
+        return np.array(spec)
+    if len(spec) == 3:
+        return np.linspace(spec[0], spec[1], int(spec[2]))
+    raise argparse.ArgumentTypeError("give one value or START STOP COUNT")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the Lorenz system over a (sigma, rho, beta) grid.")
+    for name, default in (('sigma', SIGMA), ('rho', RHO), ('beta', BETA)):
+        parser.add_argument(f'--{name}', type=float, nargs='+', default=[default], metavar='V',
+                            help=f"One value, or START STOP COUNT (default {default:g})")
+    parser.add_argument('--output', '-o', required=True, help="CSV file for the results")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=64, help="Grid points integrated together per task")
+    parser.add_argument('--steps', type=int, default=20000, help="Steps per run, including the transient")
+    parser.add_argument('--transient', type=int, default=5000, help="Initial steps excluded from statistics")
+    parser.add_argument('--dt', type=float, default=0.01)
+    parser.add_argument('--method', choices=('euler', 'rk4'), default='rk4')
+    args = parser.parse_args()
+
+    try:
+        grid = parameter_grid(_values(args.sigma), _values(args.rho), _values(args.beta))
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    # lyapunov_exponents needs one full renormalization interval after the transient
+    if args.steps - args.transient < RENORMALIZE_EVERY:
+        parser.error(f"--steps must exceed --transient by at least {RENORMALIZE_EVERY}")
+    count = write_sweep(grid, args.output, args.workers, args.chunk_size, progress=True,
+                        num_steps=args.steps, transient_steps=args.transient, dt=args.dt, method=args.method)
+    print(f"Wrote {count} rows to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from lorenz_engine import JIT_AVAILABLE, euler_steps, integrate, integrate_adaptive, lorenz, rk4_steps
+
+requires_numba = pytest.mark.skipif(not JIT_AVAILABLE, reason="numba is not installed")
+
+
+def baseline_euler(initial, num_steps, dt):
+    """The per-element loop of the original lorenz_chaos.py script."""
+    xs = np.empty(num_steps + 1)
+    ys = np.empty(num_steps + 1)
+    zs = np.empty(num_steps + 1)
+    xs[0], ys[0], zs[0] = initial
+    for i in range(num_steps):
+        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i])
+        xs[i + 1] = xs[i] + (x_dot * dt)
+        ys[i + 1] = ys[i] + (y_dot * dt)
+        zs[i + 1] = zs[i] + (z_dot * dt)
+    return np.column_stack((xs, ys, zs))
+
+
+@pytest.mark.parametrize("jit", [False, pytest.param(True, marks=requires_numba)])
+def test_euler_matches_original_loop_exactly(jit):
+    expected = baseline_euler((0., 1., 1.05), 5000, 0.01)
+    assert np.array_equal(integrate((0., 1., 1.05), 5000, 0.01, jit=jit), expected)
+
+
+@requires_numba
+@pytest.mark.parametrize("steps", [euler_steps, rk4_steps])
+def test_jit_and_python_kernels_identical(steps):
+    state = (1.5, -2.0, 20.0)
+    assert np.array_equal(steps(state, 3000, 0.005, jit=True), steps(state, 3000, 0.005, jit=False))
+
+
+@requires_numba
+def test_jit_and_python_dopri5_identical():
+    python_times, python_states = integrate_adaptive(t_end=5.0, rtol=1e-8, atol=1e-11, jit=False)
+    jit_times, jit_states = integrate_adaptive(t_end=5.0, rtol=1e-8, atol=1e-11, jit=True)
+    assert np.array_equal(jit_times, python_times)
+    assert np.array_equal(jit_states, python_states)
+
+
+def test_rk4_and_dopri5_agree_with_reference():
+    # Tight-tolerance Dormand-Prince run to t = 2, before chaos amplifies any error
+    _, reference = integrate_adaptive(t_end=2.0, rtol=1e-13, atol=1e-15, jit=False)
+    rk4 = integrate(num_steps=2000, dt=0.001, method='rk4', jit=False)
+    times, dopri5 = integrate_adaptive(t_end=2.0, rtol=1e-9, atol=1e-12, jit=False)
+    assert times[-1] == 2.0
+    np.testing.assert_allclose(rk4[-1], reference[-1], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(dopri5[-1], reference[-1], rtol=0, atol=1e-6)
+
+
+def test_integrate_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        integrate(num_steps=10, method='leapfrog')
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from lorenz_engine import integrate
+from lorenz_ensemble import integrate_ensemble, iter_ensemble, lyapunov_exponents, perturbed_ensemble
+
+
+def scalar_runs(states, num_steps, dt, s, r, b, method):
+    return np.stack([integrate(state, num_steps, dt, s_i, r_i, b_i, jit=False, method=method)
+                     for state, s_i, r_i, b_i in zip(states, s, r, b)], axis=1)
+
+
+def test_euler_ensemble_equals_scalar_runs():
+    states = perturbed_ensemble(size=16, scale=1e-3, seed=0)
+    s = np.linspace(8.0, 12.0, 16)
+    r = np.linspace(20.0, 30.0, 16)
+    b = np.full(16, 8 / 3)
+    expected = scalar_runs(states, 2000, 0.01, s, r, b, 'euler')
+    assert np.array_equal(integrate_ensemble(states, 2000, 0.01, s, r, b), expected)
+
+
+def test_rk4_ensemble_matches_scalar_runs():
+    states = perturbed_ensemble(size=16, scale=1e-3, seed=0)
+    params = [np.full(16, p) for p in (10.0, 28.0, 8 / 3)]
+    expected = scalar_runs(states, 500, 0.01, *params, 'rk4')
+    # RK4 sums its stages in a different order from the scalar kernel
+    np.testing.assert_allclose(integrate_ensemble(states, 500, 0.01, method='rk4'), expected, rtol=0, atol=1e-9)
+
+
+def test_integrate_ensemble_every_keeps_matching_snapshots():
+    states = perturbed_ensemble(size=4, seed=0)
+    full = integrate_ensemble(states, 100)
+    assert np.array_equal(integrate_ensemble(states, 100, every=25), full[::25])
+
+
+@pytest.mark.parametrize("every", [0, -1])
+def test_iter_ensemble_rejects_every_below_one(every):
+    with pytest.raises(ValueError):
+        next(iter_ensemble(perturbed_ensemble(size=2), 10, every=every))
+
+
+def test_lyapunov_exponent_of_classic_parameters():
+    states = perturbed_ensemble(size=4, scale=1.0, seed=1)
+    exponents = lyapunov_exponents(states, 30000, dt=0.01, transient_steps=2000, seed=0)
+    # The accepted value is about 0.906
+    assert np.all(np.abs(exponents - 0.9) < 0.05)
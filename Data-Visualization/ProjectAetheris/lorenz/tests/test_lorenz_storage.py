@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from lorenz_engine import integrate
+from lorenz_storage import (bounding_box, decimate, iter_chunks, iter_trajectory, load_trajectory,
+                            save_trajectory)
+
+
+@pytest.mark.parametrize("method", ['euler', 'rk4'])
+@pytest.mark.parametrize("chunk_steps", [1, 7, 1000, 5000])
+def test_iter_trajectory_chunks_equal_integrate(method, chunk_steps):
+    chunks = list(iter_trajectory(num_steps=1000, method=method, chunk_steps=chunk_steps))
+    assert all(len(chunk) <= chunk_steps for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), integrate(num_steps=1000, method=method))
+
+
+@pytest.mark.parametrize("method", ['euler', 'rk4'])
+def test_save_trajectory_equals_integrate(tmp_path, method):
+    path = tmp_path / 'run.npy'
+    saved = save_trajectory(path, num_steps=1000, method=method, chunk_steps=64)
+    assert np.array_equal(saved, integrate(num_steps=1000, method=method))
+
+
+def test_load_trajectory_round_trip(tmp_path):
+    path = tmp_path / 'run.npy'
+    save_trajectory(path, (1., 2., 3.), num_steps=500, dt=0.005, chunk_steps=100)
+    loaded = load_trajectory(path)
+    assert isinstance(loaded, np.memmap)
+    assert not loaded.flags.writeable
+    assert np.array_equal(loaded, integrate((1., 2., 3.), 500, 0.005))
+    assert np.array_equal(np.load(path), loaded)
+    assert np.array_equal(np.concatenate(list(iter_chunks(path, chunk_steps=64))), loaded)
+
+
+def test_bounding_box_over_chunks(tmp_path):
+    path = tmp_path / 'run.npy'
+    trajectory = save_trajectory(path, num_steps=2000, chunk_steps=300)
+    lows, highs = bounding_box(iter_chunks(path, chunk_steps=128))
+    assert np.array_equal(lows, trajectory.min(axis=0))
+    assert np.array_equal(highs, trajectory.max(axis=0))
+
+
+def test_decimate_copies_kept_rows_into_memory(tmp_path):
+    path = tmp_path / 'run.npy'
+    trajectory = save_trajectory(path, num_steps=999)
+    thinned = decimate(trajectory, 100)
+    assert len(thinned) <= 100
+    assert np.array_equal(thinned, trajectory[::10])
+    assert not isinstance(thinned, np.memmap)
+    assert thinned.base is None
@@ -0,0 +1,66 @@
+import csv
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from lorenz_sweep import COLUMNS, RENORMALIZE_EVERY, fixed_points, parameter_grid, summarize_chunk, write_sweep
+
+SWEEP = os.path.join(os.path.dirname(__file__), '..', 'lorenz_sweep.py')
+
+
+def test_parameter_grid_varies_rho_fastest():
+    grid = parameter_grid(sigmas=[1., 2.], rhos=[10., 20., 30.], betas=[3.])
+    assert grid.shape == (6, 3)
+    assert grid[:3].tolist() == [[1., 10., 3.], [1., 20., 3.], [1., 30., 3.]]
+
+
+def test_fixed_points():
+    origin, c_plus, c_minus = fixed_points([0.5, 28.0], [8 / 3, 8 / 3])
+    assert np.array_equal(origin, np.zeros((2, 3)))
+    # C+ and C- only exist for rho > 1
+    assert np.isnan(c_plus[0, :2]).all() and np.isnan(c_minus[0, :2]).all()
+    c = np.sqrt(8 / 3 * 27)
+    np.testing.assert_allclose(c_plus[1], [c, c, 27.0])
+    np.testing.assert_allclose(c_minus[1], [-c, -c, 27.0])
+
+
+def test_summary_labels_known_regimes():
+    stats = summarize_chunk(parameter_grid(rhos=[0.5, 15.0, 28.0]))
+    labels = stats['fixed_point'].tolist()
+    lyapunov = stats['lyapunov']
+    # rho < 1: every run decays to the origin
+    assert labels[0] == 'origin' and lyapunov[0] < 0
+    # 1 < rho < 24.74: the run settles onto one of the two convection equilibria
+    assert labels[1] in ('C+', 'C-') and lyapunov[1] < 0
+    np.testing.assert_allclose(stats['mean_z'][1], 14.0)
+    # rho = 28: chaotic, no equilibrium and a positive exponent
+    assert labels[2] == '' and lyapunov[2] > 0.5
+    assert stats['fixed_point_distance'][2] > 1.0
+
+
+def test_write_sweep_rows(tmp_path):
+    path = tmp_path / 'sweep.csv'
+    grid = parameter_grid(rhos=[0.5, 28.0])
+    assert write_sweep(grid, path, workers=1, chunk_size=1, num_steps=2000, transient_steps=500) == 2
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert tuple(rows[0]) == COLUMNS
+    assert [row['index'] for row in rows] == ['0', '1']
+    assert [row['fixed_point'] for row in rows] == ['origin', '']
+
+
+@pytest.mark.parametrize("args", [
+    ['--steps', '100', '--transient', '500'],
+    ['--steps', '100', '--transient', str(100 - RENORMALIZE_EVERY + 1)],
+    ['--chunk-size', '0'],
+    ['--chunk-size', '-3'],
+    ['--workers', '0'],
+])
+def test_cli_rejects_bad_options(tmp_path, args):
+    result = subprocess.run([sys.executable, SWEEP, '-o', str(tmp_path / 'sweep.csv'), *args],
+                            capture_output=True, text=True)
+    assert result.returncode == 2
+    assert 'error:' in result.stderr and 'Traceback' not in result.stderr
+    assert not (tmp_path / 'sweep.csv').exists()
@@ -3,8 +3,22 @@
 @date 2025-10-24
 @description Unit tests for command-line calculator functions covering arithmetic operations and expression parsing.
 """
+import contextlib
+import decimal
+import io
+import os
+import tempfile
 import unittest
-from calc123 import add, subtract, multiply, divide, calculate, parse_input, validate_operator, parse_complex_expression
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; array tests are skipped without it
+    np = None
+
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+from calc123 import add, subtract, multiply, divide, calculate, parse_input, validate_operator, parse_complex_expression, compile_expression, evaluate_stream, perform_calculation, main
 
 class TestCalculatorFunctions(unittest.TestCase):
     """Tests for basic calculator operations and expression parsing."""
@@ -58,6 +72,103 @@ class TestCalculatorFunctions(unittest.TestCase):
         self.assertEqual(parse_complex_expression("(2+3)*4"), 20)  # Tests parentheses
         self.assertEqual(parse_complex_expression("10/2"), 5)
         self.assertEqual(parse_complex_expression("10/0"), "Error: Division by zero is not allowed.")
+        self.assertEqual(parse_complex_expression("-(2+3)*+4"), -20)
+        self.assertTrue(parse_complex_expression("2**3").startswith("Error: Invalid expression."))
+
+    def test_compile_expression_cache(self):
+        compile_expression.cache_clear()
+        program = compile_expression("a+3*4", 'float')
+        self.assertEqual([opcode for opcode, _ in program], ['load', 'push', 'binary'])
+        self.assertEqual(parse_complex_expression("a+3*4", {"a": 2}), 14)
+        self.assertEqual(compile_expression.cache_info().hits, 1)
+
+    def test_compile_expression_folding(self):
+        self.assertEqual(compile_expression("-(2+3)*+4"), (('push', -20),))
+        self.assertEqual([opcode for opcode, _ in compile_expression("1/0")], ['push', 'push', 'divide'])
+        self.assertEqual(len(compile_expression("x*1+2*3")), 5)  # names are never folded
+
+    def test_parse_complex_expression_deep(self):
+        depth = 10000
+        self.assertEqual(parse_complex_expression("+".join(["1"] * depth)), depth)
+        self.assertEqual(parse_complex_expression("(" * depth + "x" + ")" * depth + "+1" * depth, {"x": 0}), depth)
+        self.assertTrue(parse_complex_expression("(2+3").startswith("Error: Invalid expression."))
+        self.assertTrue(parse_complex_expression("2+3)").startswith("Error: Invalid expression."))
+        self.assertTrue(parse_complex_expression("2 3").startswith("Error: Invalid expression."))
+
+    def test_parse_complex_expression_variables(self):
+        self.assertEqual(parse_complex_expression("a * 2 + b", {"a": 3, "b": 1}), 7)
+        self.assertEqual(parse_complex_expression("a / b", {"a": 1, "b": 0}), "Error: Division by zero is not allowed.")
+        self.assertEqual(parse_complex_expression("a + 1"), "Error: Invalid expression. Unknown variable: a")
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_parse_complex_expression_arrays(self):
+        columns = {"a": np.array([1.0, 2.0, 3.0]), "b": np.array([4.0, 5.0, 6.0]), "c": np.array([2.0, 5.0, 3.0])}
+        result = parse_complex_expression("a * 2 + b / c", columns)
+        self.assertEqual(result.tolist(), [4.0, 5.0, 8.0])
+        columns["c"][1] = 0
+        self.assertEqual(parse_complex_expression("a * 2 + b / c", columns), "Error: Division by zero is not allowed.")
+
+    def test_backends(self):
+        self.assertEqual(parse_input("0.1 + 0.2", 'decimal'), (Decimal("0.1"), '+', Decimal("0.2")))
+        self.assertEqual(parse_input("1/3 * 3", 'fraction'), (Fraction(1, 3), '*', Fraction(3)))
+        self.assertEqual(parse_input("abc + 1", 'decimal'), (None, None, None))
+        self.assertEqual(perform_calculation("0.1 + 0.2", 'decimal'), "Result: 0.3")
+        self.assertEqual(parse_complex_expression("0.1+0.2-0.3", backend='fraction'), 0)
+        self.assertEqual(parse_complex_expression("1/3", backend='fraction'), Fraction(1, 3))
+        self.assertEqual(parse_complex_expression("1/0", backend='decimal'), "Error: Division by zero is not allowed.")
+        with localcontext() as context:
+            context.prec = 5
+            self.assertEqual(parse_complex_expression("1/3", backend='decimal'), Decimal("0.33333"))
+        self.assertRaises(ValueError, parse_input, "1 + 2", 'binary')
+
+    def test_fraction_exponent_limit(self):
+        self.assertEqual(parse_input("2.5e-3 * 4", 'fraction'), (Fraction(1, 400), '*', Fraction(4)))
+        self.assertEqual(parse_complex_expression("1e300 / 1e299", backend='fraction'), 10)
+        self.assertEqual(parse_input("1e999999999 + 1", 'fraction'), (None, None, None))
+        self.assertTrue(parse_complex_expression("1e999999999+1", backend='fraction').startswith("Error: Invalid expression."))
+        self.assertTrue(perform_calculation("1E-999999999 * 2", 'fraction').startswith("Error: Invalid input format."))
+
+    def test_precision_must_be_positive(self):
+        for precision in ("0", "-3", "ten", str(decimal.MAX_PREC + 1)):
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                main(["--precision", precision, "--batch", os.devnull])
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn("--precision", stderr.getvalue())
+
+    def test_evaluate_stream_decimal_signals(self):
+        output = io.StringIO()
+        count = evaluate_stream(io.StringIO("1 + 2\n1e999999999 * 1e999999999\nsnan + 1\n3 + 4\n"), output, 'decimal')
+        self.assertEqual(count, 4)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "Result: 3")
+        self.assertTrue(lines[1].startswith("Error: Invalid calculation."))
+        self.assertTrue(lines[2].startswith("Error: Invalid calculation."))
+        self.assertEqual(lines[3], "Result: 7")
+
+    def test_evaluate_stream(self):
+        output = io.StringIO()
+        count = evaluate_stream(io.StringIO("5 + 3\n\n2+3*4\n10 / 0\n"), output)
+        self.assertEqual(count, 4)
+        self.assertEqual(output.getvalue().splitlines(), [
+            "Result: 8.0",
+            "",
+            "Result: 14",
+            "Error: Division by zero is not allowed.",
+        ])
+
+    def test_batch_file_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            missing = os.path.join(directory, "missing.txt")
+            expressions = os.path.join(directory, "expressions.txt")
+            with open(expressions, "w") as f:
+                f.write("1 + 2\n")
+            for argv in (["--batch", missing], ["--batch", expressions, "--output", directory]):
+                stderr = io.StringIO()
+                with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                    main(argv)
+                self.assertEqual(raised.exception.code, 2)
+                self.assertIn("error:", stderr.getvalue())
 
 if __name__ == "__main__":
     unittest.main()
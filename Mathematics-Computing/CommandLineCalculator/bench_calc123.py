@@ -0,0 +1,115 @@
+"""
+@author Tom Butler
+@date 2025-10-24
+@description Throughput benchmark for the complex expression engine on deep and wide expressions,
+             and for each numeric backend (float, decimal, fraction).
+
+Run from the CommandLineCalculator directory:
+    python bench_calc123.py
+    python bench_calc123.py --terms 100000 --repeats 5
+
+Compile times are measured with a cold expression cache; evaluate times run
+an already compiled program, as repeated batch-mode formulas do. The backend
+table runs money-style batch input through evaluate_stream once per backend.
+"""
+import argparse
+import io
+import time
+
+from calc123 import BACKENDS, compile_expression, evaluate_stream, run_program
+
+def chain(terms):
+    """
+    @param {int} terms - Number of operands.
+    @return {tuple} (name, expression, variables) for a flat chain of literal additions.
+    """
+    return "chain of literals", "+".join(str(i % 10) for i in range(terms)), {}
+
+def chain_variables(terms):
+    """
+    @param {int} terms - Number of operands.
+    @return {tuple} (name, expression, variables) for a chain mixing a variable and literals.
+    """
+    return "chain with names", "+".join("x*2" if i % 2 else "3" for i in range(terms)), {"x": 1.5}
+
+def nested(terms):
+    """
+    @param {int} terms - Nesting depth.
+    @return {tuple} (name, expression, variables) for deeply nested parentheses.
+    """
+    return "nested parentheses", "(" * terms + "x" + "".join(f"+{i % 7 + 1})/2" for i in range(terms)), {"x": 1.0}
+
+def wide(terms):
+    """
+    @param {int} terms - Number of products.
+    @return {tuple} (name, expression, variables) for a sum of many distinct variable products.
+    """
+    names = [f"v{i}" for i in range(terms)]
+    return "wide sum of products", "+".join(f"{name}*{i % 5 + 1}" for i, name in enumerate(names)), \
+        {name: float(i) for i, name in enumerate(names)}
+
+def money_lines(count):
+    """
+    @param {int} count - Number of lines.
+    @return {list} Batch input lines of prices, quantities and discounts, simple and complex forms mixed.
+    """
+    lines = []
+    for i in range(count):
+        price = f"{i % 100}.{i % 97:02d}"
+        if i % 2:
+            lines.append(f"{price} * {i % 9 + 1}\n")
+        else:
+            lines.append(f"{price}*{i % 9 + 1}-{price}*0.15+{i % 13}.99/3\n")
+    return lines
+
+def best_time(fn, repeats):
+    """
+    @param {callable} fn - Function to time.
+    @param {int} repeats - Number of runs.
+    @return {float} Fastest wall-clock time in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the calc123 expression engine")
+    parser.add_argument('--terms', type=int, default=10000, help="Operands (or nesting depth) per expression")
+    parser.add_argument('--lines', type=int, default=100000, help="Batch lines per backend")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    def compile_cold(expression):
+        compile_expression.cache_clear()
+        compile_expression(expression)
+
+    print(f"{'case':<22} {'chars':>9} {'opcodes':>8} {'compile s':>10} {'chars/s':>12} {'eval s':>10} {'opcodes/s':>12}")
+    for case in (chain, chain_variables, nested, wide):
+        name, expression, variables = case(args.terms)
+        compile_seconds = best_time(lambda: compile_cold(expression), args.repeats)
+        program = compile_expression(expression)
+        eval_seconds = best_time(lambda: run_program(program, variables), args.repeats)
+        print(
+            f"{name:<22} {len(expression):>9} {len(program):>8} {compile_seconds:>10.4f} "
+            f"{len(expression) / compile_seconds:>12.0f} {eval_seconds:>10.5f} {len(program) / eval_seconds:>12.0f}"
+        )
+
+    lines = money_lines(args.lines)
+    # Names are never folded, so every backend runs the full chain of additions
+    program = compile_expression("+".join(["x"] * args.terms))
+    print()
+    print(f"{'backend':<10} {'batch s':>9} {'lines/s':>10} {'chain eval s':>13} {'opcodes/s':>12}")
+    for backend in BACKENDS:
+        batch_seconds = best_time(lambda: evaluate_stream(lines, io.StringIO(), backend), args.repeats)
+        variables = {"x": BACKENDS[backend]("1.25")}
+        eval_seconds = best_time(lambda: run_program(program, variables), args.repeats)
+        print(
+            f"{backend:<10} {batch_seconds:>9.3f} {len(lines) / batch_seconds:>10.0f} "
+            f"{eval_seconds:>13.5f} {len(program) / eval_seconds:>12.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
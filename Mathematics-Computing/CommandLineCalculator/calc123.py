@@ -3,8 +3,55 @@
 @date 2025-10-24
 @description Command-line calculator implementing basic arithmetic operations with support for complex expressions and operator precedence.
 """
-import ast
+import argparse
+import decimal
 import operator
+import re
+import sys
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+# Binary operators supported in complex expressions
+OPERATIONS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv
+}
+
+# Numeric backends: the type operands are converted to. Decimal arithmetic
+# follows the active decimal context (see --precision and --rounding).
+BACKENDS = {
+    'float': float,
+    'decimal': Decimal,
+    'fraction': Fraction
+}
+
+# Binding strength of each operator; unary signs ('u+', 'u-') bind tightest
+PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, 'u+': 3, 'u-': 3}
+
+# One token of a complex expression: a number literal, a variable name or an operator
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?[jJ]?)|(?P<name>[A-Za-z_]\w*)|(?P<symbol>[-+*/()]))"
+)
+
+# Opcodes of a compiled expression program (postfix order)
+PUSH = 'push'
+LOAD = 'load'
+BINARY = 'binary'
+DIVIDE = 'divide'
+NEGATE = 'negate'
+
+# Number of distinct compiled expressions kept, least recently used evicted first
+EXPRESSION_CACHE_SIZE = 1024
+
+# Buffer size in bytes for batch-mode input and output files
+BATCH_BUFFER_SIZE = 1 << 20
+
+# Largest decimal exponent accepted in a fraction literal; Fraction expands
+# "1e999999999" into an exact integer with that many digits
+MAX_FRACTION_EXPONENT = 4300
 
 def add(number1, number2):
     """
@@ -32,25 +79,65 @@ def multiply(number1, number2):
 
 def divide(number1, number2):
     """
-    @param {float} number1 - Dividend.
-    @param {float} number2 - Divisor.
-    @return {float|str} Quotient or error message if dividing by zero.
+    @param {float|Decimal|Fraction} number1 - Dividend.
+    @param {float|Decimal|Fraction} number2 - Divisor, of the same numeric type as the dividend.
+    @return {float|Decimal|Fraction|str} Quotient or error message if dividing by zero.
     """
     if number2 == 0:
         return "Error: Division by zero is not allowed."
     return number1 / number2
 
-def parse_input(expression):
+def parse_fraction(text):
+    """
+    @param {str} text - Number literal, e.g. "0.1", "1/3" or "2.5e-3".
+    @return {Fraction} Exact value of the literal.
+    @throws {ValueError} If the literal is malformed or its exponent exceeds MAX_FRACTION_EXPONENT.
+    """
+    _, _, exponent = text.lower().partition('e')
+    if exponent and abs(int(exponent)) > MAX_FRACTION_EXPONENT:
+        raise ValueError(f"exponent too large for the fraction backend: {text}")
+    return Fraction(text)
+
+def number_type(backend):
+    """
+    @param {str} backend - Numeric backend name: 'float', 'decimal' or 'fraction'.
+    @return {callable} Converter from a number literal to that backend's type.
+    @throws {ValueError} If the backend is unknown.
+    """
+    try:
+        convert = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {backend}. Choose one of: {', '.join(BACKENDS)}") from None
+    return parse_fraction if convert is Fraction else convert
+
+def positive_int(text):
+    """
+    @param {str} text - Command-line argument.
+    @return {int} The argument as an integer of at least 1.
+    @throws {argparse.ArgumentTypeError} If the argument is not a positive integer.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}")
+    return value
+
+def parse_input(expression, backend='float'):
     """
     @param {str} expression - Input in format "number1 operator number2".
+    @param {str} backend - Numeric backend operands are converted with ('float', 'decimal' or 'fraction').
     @return {tuple} (number1, operator, number2) or (None, None, None) if parsing fails.
     """
+    convert = number_type(backend)
     try:
         number1, operator, number2 = expression.split()
-        number1 = float(number1)
-        number2 = float(number2)
+        number1 = convert(number1)
+        number2 = convert(number2)
         return number1, operator, number2
-    except ValueError:
+    except (ValueError, ArithmeticError):
+        # Decimal reports malformed numbers with InvalidOperation, an ArithmeticError
         return None, None, None
 
 def validate_operator(operator):
@@ -62,10 +149,10 @@ def validate_operator(operator):
 
 def calculate(number1, operator, number2):
     """
-    @param {float} number1 - First operand.
+    @param {float|Decimal|Fraction} number1 - First operand.
     @param {str} operator - Mathematical operator (+, -, *, /).
-    @param {float} number2 - Second operand.
-    @return {float|str} Result of calculation or error message.
+    @param {float|Decimal|Fraction} number2 - Second operand, of the same numeric type as the first.
+    @return {float|Decimal|Fraction|str} Result of calculation or error message.
     """
     if operator == '+':
         return add(number1, number2)
@@ -78,68 +165,193 @@ def calculate(number1, operator, number2):
     else:
         return "Error: Invalid operator. Please use one of the following operators: +, -, *, /"
 
-def parse_complex_expression(expression):
+def tokenize(expression, backend='float'):
     """
     @param {str} expression - Complex mathematical expression (e.g., "10 + 2 * 6").
-    @return {float|str} Result of the expression or error message.
+    @param {str} backend - Numeric backend number literals are converted with.
+    @return {generator} (kind, value) pairs, kind being 'number', 'name' or 'symbol'.
+    @throws {SyntaxError} If the expression contains a character that starts no token.
+    """
+    convert = number_type(backend)
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            offending = len(expression) - len(expression[position:].lstrip())
+            raise SyntaxError(f"invalid syntax at position {offending + 1}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'number' and backend != 'float':
+            if text[-1] in 'jJ':
+                raise SyntaxError(f"complex numbers are not supported by the {backend} backend")
+            yield kind, convert(text)
+        elif kind == 'number':
+            if text[-1] in 'jJ':
+                yield kind, complex(text)
+            elif '.' in text or 'e' in text or 'E' in text:
+                yield kind, float(text)
+            else:
+                yield kind, int(text)
+        else:
+            yield kind, text
+        position = match.end()
+
+def emit_operator(program, symbol, fold=True):
+    """
+    @param {list} program - Postfix program being built; modified in place.
+    @param {str} symbol - Binary operator, or 'u+'/'u-' for a unary sign.
+    @param {bool} fold - Fold the operator into a constant when all its operands are literals.
+    @return None - Appends the operator to the program.
     """
-    operations = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv
-    }
+    if symbol == 'u+':
+        return
+    if symbol == 'u-':
+        if fold and program[-1][0] == PUSH:
+            program[-1] = (PUSH, -program[-1][1])
+        else:
+            program.append((NEGATE, None))
+        return
+    opcode = DIVIDE if symbol == '/' else BINARY
+    function = OPERATIONS[symbol]
+    # A literal operand is always a single PUSH, so two trailing PUSHes are
+    # exactly this operator's operands. Division by a literal zero is left
+    # for run_program to report.
+    if fold and program[-1][0] == PUSH and program[-2][0] == PUSH \
+            and not (opcode == DIVIDE and program[-1][1] == 0):
+        right = program.pop()[1]
+        program[-1] = (PUSH, function(program[-1][1], right))
+    else:
+        program.append((opcode, function))
 
-    try:
-        node = ast.parse(expression, mode='eval').body
-
-        def evaluate(node):
-            if isinstance(node, ast.Num):
-                return node.value
-            elif isinstance(node, ast.BinOp):
-                left = evaluate(node.left)
-                right = evaluate(node.right)
-
-                if isinstance(node.op, ast.Div) and right == 0:
-                    raise ZeroDivisionError("Division by zero is not allowed.")
-
-                return operations[type(node.op)](left, right)
-            elif isinstance(node, ast.UnaryOp):
-                operand = evaluate(node.operand)
-                if isinstance(node.op, ast.USub):
-                    return -operand
-                if isinstance(node.op, ast.UAdd):
-                    return operand
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression, backend='float'):
+    """
+    @param {str} expression - Complex mathematical expression (e.g., "10 + 2 * 6").
+    @param {str} backend - Numeric backend number literals are converted with.
+    @return {tuple} Flat postfix program of (opcode, argument) pairs, cached by expression text and backend.
+    @throws {SyntaxError} If the expression is malformed or uses unsupported operators.
+    @throws {ValueError} If the backend is unknown.
+    """
+    # Decimal results depend on the context active when they are computed,
+    # which may differ between compiling (cached) and running the program.
+    fold = backend != 'decimal'
+    # Shunting-yard with an explicit operator stack, so nesting depth and
+    # expression length are limited only by memory, never by recursion.
+    program = []
+    pending = []
+    expect_operand = True
+    for kind, value in tokenize(expression, backend):
+        if expect_operand:
+            if kind == 'number':
+                program.append((PUSH, value))
+                expect_operand = False
+            elif kind == 'name':
+                program.append((LOAD, value))
+                expect_operand = False
+            elif value == '(':
+                pending.append(value)
+            elif value in '+-':
+                pending.append('u' + value)
             else:
-                raise TypeError(f"Unsupported operation: {node}")
+                raise SyntaxError(f"unexpected '{value}'")
+        elif kind == 'symbol' and value == ')':
+            while pending and pending[-1] != '(':
+                emit_operator(program, pending.pop(), fold)
+            if not pending:
+                raise SyntaxError("unmatched ')'")
+            pending.pop()
+        elif kind == 'symbol' and value in OPERATIONS:
+            while pending and pending[-1] != '(' and PRECEDENCE[pending[-1]] >= PRECEDENCE[value]:
+                emit_operator(program, pending.pop(), fold)
+            pending.append(value)
+            expect_operand = True
+        else:
+            raise SyntaxError(f"unexpected '{value}'")
 
-        result = evaluate(node)
-        return result
+    if expect_operand:
+        raise SyntaxError("unexpected end of expression")
+    while pending:
+        symbol = pending.pop()
+        if symbol == '(':
+            raise SyntaxError("'(' was never closed")
+        emit_operator(program, symbol, fold)
+    return tuple(program)
+
+def contains_zero(value):
+    """
+    @param {float|ndarray} value - Divisor, either a number or an array of numbers.
+    @return {bool} True if the number is zero, or if any element of the array is zero.
+    """
+    zero = value == 0
+    return bool(zero.any()) if hasattr(zero, 'any') else bool(zero)
+
+def run_program(program, variables=None):
+    """
+    @param {tuple} program - Postfix program from compile_expression.
+    @param {dict|None} variables - Values for named variables; NumPy arrays evaluate element-wise.
+    @return {float|ndarray} Result of executing the program.
+    @throws {ZeroDivisionError} If a divisor (or any divisor element) evaluates to zero.
+    @throws {NameError} If the program uses a variable missing from variables.
+    """
+    stack = []
+    push = stack.append
+    for opcode, argument in program:
+        if opcode == PUSH:
+            push(argument)
+        elif opcode == LOAD:
+            if variables is None or argument not in variables:
+                raise NameError(f"Unknown variable: {argument}")
+            push(variables[argument])
+        elif opcode == NEGATE:
+            stack[-1] = -stack[-1]
+        else:
+            right = stack.pop()
+            if opcode == DIVIDE and contains_zero(right):
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            stack[-1] = argument(stack[-1], right)
+    return stack[0]
+
+def parse_complex_expression(expression, variables=None, backend='float'):
+    """
+    @param {str} expression - Complex mathematical expression (e.g., "10 + 2 * 6" or "a * 2 + b / c").
+    @param {dict|None} variables - Values for named variables. Binding NumPy arrays evaluates
+                                   the whole expression over every element in one vectorized pass.
+    @param {str} backend - Numeric backend for number literals ('float', 'decimal' or 'fraction').
+    @return {float|Decimal|Fraction|ndarray|str} Result of the expression or error message.
+    """
+    try:
+        return run_program(compile_expression(expression, backend), variables)
 
-    except ZeroDivisionError:
+    except (ZeroDivisionError, decimal.DivisionByZero):
         return "Error: Division by zero is not allowed."
-    except (SyntaxError, TypeError, ValueError) as e:
+    except (SyntaxError, TypeError, ValueError, NameError, ArithmeticError) as e:
         return f"Error: Invalid expression. {str(e)}"
 
-def perform_calculation(expression):
+def perform_calculation(expression, backend='float'):
     """
     @param {str} expression - Mathematical expression to evaluate.
+    @param {str} backend - Numeric backend ('float', 'decimal' or 'fraction').
     @return {str} Result with "Result: " prefix or error message.
     """
     # Try complex expression parsing first for multi-operation expressions
     if any(op in expression for op in "+-*/") and not expression.count(' ') == 2:
-        result = parse_complex_expression(expression)
+        result = parse_complex_expression(expression, backend=backend)
         if not isinstance(result, str) or result.startswith("Error"):
             return f"Result: {result}" if not isinstance(result, str) else result
 
-    number1, operator, number2 = parse_input(expression)
+    number1, operator, number2 = parse_input(expression, backend)
     if number1 is None or operator is None or number2 is None:
         return "Error: Invalid input format. Please ensure that both operands are numbers and use the format: [number1] [operator] [number2]"
 
     if not validate_operator(operator):
         return "Error: Invalid operator. Please use one of the following operators: +, -, *, /"
 
-    result = calculate(number1, operator, number2)
+    try:
+        result = calculate(number1, operator, number2)
+    except ArithmeticError as e:
+        # Decimal traps (Overflow, InvalidOperation, ...) must not abort a batch
+        return f"Error: Invalid calculation. {str(e)}"
     if isinstance(result, str):
         return result
     return f"Result: {result}"
@@ -160,8 +372,9 @@ def show_help():
     """
     print(help_message)
 
-def handle_user_interaction():
+def handle_user_interaction(backend='float'):
     """
+    @param {str} backend - Numeric backend ('float', 'decimal' or 'fraction').
     @return None - Manages interactive REPL loop for calculator operations.
     """
     print("Welcome to the Command-Line Calculator!")
@@ -175,7 +388,7 @@ def handle_user_interaction():
         elif expression == 'help':
             show_help()
         else:
-            output = perform_calculation(expression)
+            output = perform_calculation(expression, backend)
             print(output)
 
             while True:
@@ -188,5 +401,87 @@ def handle_user_interaction():
                 else:
                     print("Invalid input. Please type 'yes' or 'no'.")
 
+def evaluate_stream(lines, output, backend='float'):
+    """
+    @param {iterable} lines - Expressions, one per line (e.g. an open file or sys.stdin).
+    @param {file} output - Writable text stream receiving one result line per input line.
+    @param {str} backend - Numeric backend ('float', 'decimal' or 'fraction').
+    @return {int} Number of lines evaluated.
+    """
+    count = 0
+
+    def results():
+        nonlocal count
+        for line in lines:
+            count += 1
+            expression = line.strip().lower()
+            # Blank lines stay blank so output lines match input lines
+            yield (perform_calculation(expression, backend) if expression else "") + "\n"
+
+    output.writelines(results())
+    return count
+
+def run_batch(input_path, output_path=None, backend='float'):
+    """
+    @param {str} input_path - File of expressions, or '-' for stdin.
+    @param {str|None} output_path - File for results, or None for stdout.
+    @param {str} backend - Numeric backend ('float', 'decimal' or 'fraction').
+    @return {int} Number of lines evaluated.
+    @throws {OSError} If the input file cannot be read or the output file cannot be written.
+    """
+    source = sys.stdin if input_path == '-' else open(input_path, buffering=BATCH_BUFFER_SIZE)
+    target = None
+    try:
+        target = sys.stdout if output_path is None else open(output_path, 'w', buffering=BATCH_BUFFER_SIZE)
+        return evaluate_stream(source, target, backend)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is sys.stdout:
+            target.flush()
+        elif target is not None:
+            target.close()
+
+def main(argv=None):
+    """
+    @param {list|None} argv - Command-line arguments (defaults to sys.argv).
+    @return None - Runs the interactive calculator, or batch mode with --batch.
+    """
+    parser = argparse.ArgumentParser(description="Command-line calculator")
+    parser.add_argument(
+        '--batch', '-b', nargs='?', const='-', metavar='FILE',
+        help="Evaluate expressions from FILE (stdin if omitted or '-'), one per line, and exit"
+    )
+    parser.add_argument('--output', '-o', metavar='FILE', help="Write batch results to FILE instead of stdout")
+    parser.add_argument(
+        '--backend', choices=BACKENDS, default='float',
+        help="Numeric type: binary float (default), decimal, or exact fraction"
+    )
+    parser.add_argument(
+        '--precision', type=positive_int, metavar='DIGITS',
+        help="Significant digits for the decimal backend (default 28)"
+    )
+    parser.add_argument(
+        '--rounding', choices=[name for name in dir(decimal) if name.startswith('ROUND_')],
+        help="Rounding mode for the decimal backend (default ROUND_HALF_EVEN)"
+    )
+    args = parser.parse_args(argv)
+
+    context = decimal.getcontext()
+    if args.precision is not None:
+        if args.precision > decimal.MAX_PREC:
+            parser.error(f"argument --precision: at most {decimal.MAX_PREC} digits")
+        context.prec = args.precision
+    if args.rounding is not None:
+        context.rounding = args.rounding
+
+    if args.batch is None:
+        handle_user_interaction(args.backend)
+    else:
+        try:
+            run_batch(args.batch, args.output, args.backend)
+        except OSError as e:
+            parser.error(str(e))
+
 if __name__ == "__main__":
-    handle_user_interaction()
+    main()
@@ -1,41 +1,299 @@
 import matplotlib.pyplot as plt
 import math
+import numpy as np
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from decimal import Decimal, localcontext, MAX_EMAX, MIN_EMIN
+from functools import lru_cache
+
+# Below this index fibonacci_log uses the exact term instead of the closed form
+EXACT_LOG_LIMIT = 70
+# Plots longer than this are drawn as min/max pairs per bucket (about one per pixel column)
+PLOT_BUCKETS = 2000
+# Extra digits carried internally by the Decimal golden ratio routines
+GUARD_DIGITS = 10
+# fib_mod_batch looks up answers in a precomputed table for periods up to this length
+PISANO_TABLE_LIMIT = 1 << 20
+
+def iter_fibonacci(n):
+    """Yield the first n Fibonacci terms one at a time, holding only the last two"""
+    a, b = 0, 1
+    for _ in range(n):
+        yield a
+        a, b = b, a + b
 
 def fibonacci(n):
     """Generate a Fibonacci sequence up to the nth term"""
     if n <= 0:
         return []
-    elif n == 1:
-        return [0]
-    elif n == 2:
-        return [0, 1]
-
-    fib_sequence = [0, 1]
-    for _ in range(2, n):
-        fib_sequence.append(fib_sequence[-1] + fib_sequence[-2])
-    return fib_sequence
-
-def visualize_fibonacci_ascii(sequence):
-    """Visualize the Fibonacci sequence using ASCII art with improved scaling"""
-    if not sequence:
-        print("No sequence to visualize")
-        return
+    return list(iter_fibonacci(n))
+
+def fib_pair(n):
+    """Return (F(n), F(n+1)) by fast doubling in O(log n) multiplications"""
+    if n < 0:
+        raise ValueError("n must be a non-negative integer")
+
+    a, b = 0, 1  # F(k), F(k+1), starting from k = 0
+    for bit in bin(n)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+def combine_pairs(pair_k, pair_d):
+    """Given (F(k), F(k+1)) and (F(d), F(d+1)), return (F(k+d), F(k+d+1))"""
+    fk, fk1 = pair_k
+    fd, fd1 = pair_d
+    # F(k+d) = F(k)F(d+1) + F(k-1)F(d), with F(k-1) = F(k+1) - F(k)
+    return fk * fd1 + (fk1 - fk) * fd, fk1 * fd1 + fk * fd
+
+class FibonacciCache:
+    """Thread-safe LRU cache of (F(n), F(n+1)) checkpoints shared across queries
+
+    A miss extends from the nearest cached checkpoint below n: a few plain
+    additions when it is close, or fast doubling for the gap combined with the
+    checkpoint when the gap is small next to it. Combining costs four
+    multiplications of full-size terms, so far queries use fib_pair(n) directly.
+    Bounded by entry count and by the total bit length of the cached terms.
+    """
+
+    def __init__(self, max_entries=256, max_bits=1 << 26, step_limit=64, combine_ratio=8):
+        self.max_entries = max_entries
+        self.max_bits = max_bits
+        self.step_limit = step_limit  # Gaps up to this size are walked term by term
+        self.combine_ratio = combine_ratio  # Longer gaps only extend checkpoints above gap * combine_ratio
+        self._pairs = OrderedDict()
+        self._bits = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+
+    def pair(self, n):
+        """Return (F(n), F(n+1)), reusing cached checkpoints where possible"""
+        if n < 0:
+            raise ValueError("n must be a non-negative integer")
+
+        with self._lock:
+            if n in self._pairs:
+                self._pairs.move_to_end(n)
+                self.hits += 1
+                return self._pairs[n]
+            base = max((k for k in self._pairs if k < n), default=None)
+            if base is not None and n - base > max(self.step_limit, base // self.combine_ratio):
+                # Computing from scratch is cheaper than extending a distant checkpoint
+                base = None
+            base_pair = self._pairs[base] if base is not None else None
+
+        # Compute outside the lock so slow queries don't block other threads
+        if base is None:
+            result = fib_pair(n)
+        elif n - base <= self.step_limit:
+            a, b = base_pair
+            for _ in range(n - base):
+                a, b = b, a + b
+            result = (a, b)
+        else:
+            result = combine_pairs(base_pair, fib_pair(n - base))
+
+        with self._lock:
+            if base is None:
+                self.misses += 1
+            else:
+                self.extensions += 1
+            if n not in self._pairs:
+                self._pairs[n] = result
+                self._bits += result[0].bit_length() + result[1].bit_length()
+                self._evict()
+        return result
+
+    def _evict(self):
+        """Drop least recently used checkpoints until within both bounds (lock held)"""
+        while self._pairs and (len(self._pairs) > self.max_entries or self._bits > self.max_bits):
+            _, (low, high) = self._pairs.popitem(last=False)
+            self._bits -= low.bit_length() + high.bit_length()
+
+    def stats(self):
+        """Return hit/extension/miss counters and current size"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "extensions": self.extensions,
+                "misses": self.misses,
+                "entries": len(self._pairs),
+                "bits": self._bits,
+            }
+
+    def clear(self):
+        """Empty the cache and reset the counters"""
+        with self._lock:
+            self._pairs.clear()
+            self._bits = 0
+            self.hits = self.extensions = self.misses = 0
+
+# Shared by fib() and the menu so repeated queries reuse earlier work
+fib_cache = FibonacciCache()
+
+def fib(n):
+    """Return the nth Fibonacci number F(n) without building the sequence"""
+    return fib_cache.pair(n)[0]
+
+def fib_pair_mod(n, m):
+    """Return (F(n) mod m, F(n+1) mod m) by fast doubling with modular reduction"""
+    if n < 0 or m < 1:
+        raise ValueError("n must be non-negative and m positive")
+
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == '1':
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+def fib_mod(n, m):
+    """Return F(n) mod m in O(log n) steps; n may be as large as 10^18 and beyond"""
+    return fib_pair_mod(n, m)[0]
+
+def factorize(n):
+    """Prime factorization {p: exponent} of n by trial division"""
+    factors = {}
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+def _divisors(factors):
+    """All divisors of the number with the given factorization, in ascending order"""
+    divisors = [1]
+    for p, e in factors.items():
+        divisors = [d * p ** k for d in divisors for k in range(e + 1)]
+    return sorted(divisors)
+
+def _pisano_prime(p):
+    """Pisano period of a prime p"""
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # The period divides p - 1 when p = ±1 (mod 5), otherwise 2(p + 1)
+    bound = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    for d in _divisors(factorize(bound)):
+        if fib_pair_mod(d, p) == (0, 1):
+            return d
+    return bound
+
+@lru_cache(maxsize=1024)
+def pisano_period(m):
+    """Pisano period of m: F(n) mod m == F(n mod period) mod m
+
+    pi is lcm-multiplicative, so the period is built from the factorization of m.
+    Prime powers use pi(p^k) = p^(k-1) * pi(p). That formula rests on Wall's
+    conjecture, which is unproven but has no known counterexample. Factoring is
+    trial division, so m should stay below ~10^12.
+    """
+    if m < 1:
+        raise ValueError("m must be a positive integer")
+    period = 1
+    for p, k in factorize(m).items():
+        prime_power_period = _pisano_prime(p) * p ** (k - 1)
+        period = period * prime_power_period // math.gcd(period, prime_power_period)
+    return period
+
+def fib_mod_batch(queries):
+    """Answer many (n, m) queries for F(n) mod m in one call, in input order
+
+    Queries are grouped by modulus. A modulus with enough queries to pay for a
+    full period table gets its Pisano period and every answer becomes a lookup;
+    all other queries go straight to fast doubling, which needs no factoring.
+    """
+    by_modulus = defaultdict(list)
+    for index, (n, m) in enumerate(queries):
+        # Checked up front so the outcome never depends on which path a query takes
+        if n < 0 or m < 1:
+            raise ValueError("n must be non-negative and m positive")
+        by_modulus[m].append((index, n))
+
+    answers = [0] * len(queries)
+    for m, group in by_modulus.items():
+        # pi(m) <= 6m, so this bound guarantees the table is short enough to be
+        # worth building: one addition per entry against ~log2(n) doubling steps
+        # per query. Factoring m for a period that can't be tabulated would cost
+        # far more than the few doubling steps reducing n by it could save.
+        if 6 * m <= min(PISANO_TABLE_LIMIT, 64 * len(group)):
+            period = pisano_period(m)
+            table = [0] * period
+            a, b = 0, 1 % m
+            for i in range(period):
+                table[i] = a
+                a, b = b, (a + b) % m
+            for index, n in group:
+                answers[index] = table[n % period]
+        else:
+            for index, n in group:
+                answers[index] = fib_mod(n, m)
+    return answers
+
+def fibonacci_log(k):
+    """Natural log of F(k) + 1, from the closed form F(k) ~ phi^k / sqrt(5) for large k"""
+    if k <= EXACT_LOG_LIMIT:
+        return math.log(fib_pair(k)[0] + 1)
+    return k * math.log((1 + math.sqrt(5)) / 2) - 0.5 * math.log(5)
+
+def visualize_fibonacci_ascii(sequence, count=None):
+    """Visualize the Fibonacci sequence using ASCII art with improved scaling
+
+    Pass count to stream any iterable of the first count terms (e.g. iter_fibonacci(count)):
+    the scale comes from the closed form of F(count - 1), so no term is stored.
+    """
+    streamed = count is not None
+    if not streamed:
+        if not sequence:
+            print("No sequence to visualize")
+            return
+        count = len(sequence)
+        max_value = max(sequence)
+        log_max = math.log(max_value + 1)
+    else:
+        if count < 1:
+            print("No sequence to visualize")
+            return
+        # The largest of the first count terms is the last one, F(count - 1)
+        max_value = fib_pair(count - 1)[0] if count - 1 <= EXACT_LOG_LIMIT else None
+        log_max = fibonacci_log(count - 1)
 
-    if len(sequence) == 1:
-        print(f"{sequence[0]}: *")
+    terms = iter(sequence)
+    if count == 1:
+        print(f"{next(terms)}: *")
         return
 
-    max_value = max(sequence)
     max_width = 50  # Maximum width for ASCII visualization
 
     print("\nFibonacci Sequence ASCII Visualization:")
     print("-" * 40)
 
-    for i, value in enumerate(sequence):
-        if max_value > 0:
+    for i, value in enumerate(terms):
+        if log_max > 0:
             # Use logarithmic scaling for large numbers
-            if max_value > 100:
-                scaled_width = int((math.log(value + 1) / math.log(max_value + 1)) * max_width)
+            if max_value is None or max_value > 100:
+                # Streamed terms use the same closed form as log_max, so the last bar is full width
+                if streamed and i > EXACT_LOG_LIMIT:
+                    log_value = fibonacci_log(i)
+                else:
+                    log_value = math.log(value + 1)
+                scaled_width = int((log_value / log_max) * max_width)
             else:
                 scaled_width = int((value / max_value) * max_width)
         else:
@@ -43,14 +301,68 @@ def visualize_fibonacci_ascii(sequence):
 
         print(f"F({i:2d}) = {value:8d}: " + "*" * scaled_width)
 
-def plot_fibonacci(sequence):
-    """Plot the Fibonacci sequence using matplotlib"""
-    plt.plot(sequence, marker='o', linestyle='-', color='b')
+def fibonacci_log10_values(sequence):
+    """log10(value + 1) for every term as a float array; works for terms beyond float range"""
+    # math.log10 reads big ints directly instead of converting them to float first
+    return np.fromiter((math.log10(value + 1) for value in sequence), dtype=float, count=len(sequence))
+
+def fibonacci_log10_terms(n):
+    """log10(F(k) + 1) for k in range(n) without computing any term past EXACT_LOG_LIMIT"""
+    k = np.arange(n, dtype=float)
+    values = k * math.log10((1 + math.sqrt(5)) / 2) - 0.5 * math.log10(5)
+    exact = min(n, EXACT_LOG_LIMIT + 1)
+    values[:exact] = fibonacci_log10_values(fibonacci(exact))
+    return values
+
+def decimate_minmax(values, buckets=PLOT_BUCKETS):
+    """Reduce values to a (min, max) pair per bucket so peaks survive downsampling
+
+    Returns (x, y) arrays; inputs with at most 2 * buckets points come back unchanged.
+    """
+    n = len(values)
+    if n <= 2 * buckets:
+        return np.arange(n), values
+    starts = np.linspace(0, n, buckets + 1).astype(np.int64)[:-1]
+    ends = np.append(starts[1:], n) - 1
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+    x = np.column_stack((starts, ends)).ravel()
+    y = np.column_stack((mins, maxs)).ravel()
+    return x, y
+
+def _plot_log10(values):
+    """Draw decimated log10 values of a long sequence"""
+    x, y = decimate_minmax(values)
+    plt.plot(x, y, linestyle='-', color='b')
     plt.title('Fibonacci Sequence')
     plt.xlabel('Term')
-    plt.ylabel('Value')
+    plt.ylabel('log10(Value)')
     plt.show()
 
+def plot_fibonacci(sequence):
+    """Plot the Fibonacci sequence using matplotlib
+
+    Long sequences (or terms beyond float range) are plotted as log10 values,
+    computed in bulk and min/max decimated to about PLOT_BUCKETS columns.
+    """
+    if len(sequence) <= 2 * PLOT_BUCKETS and (not sequence or max(sequence) < 1e300):
+        plt.plot(sequence, marker='o', linestyle='-', color='b')
+        plt.title('Fibonacci Sequence')
+        plt.xlabel('Term')
+        plt.ylabel('Value')
+        plt.show()
+        return
+
+    _plot_log10(fibonacci_log10_values(sequence))
+
+def plot_fibonacci_terms(n):
+    """Plot the first n terms without materializing them (closed-form log10 for long runs)"""
+    if n <= 2 * PLOT_BUCKETS:
+        plot_fibonacci(fibonacci(n))
+        return
+
+    _plot_log10(fibonacci_log10_terms(n))
+
 def golden_ratio_approximation(sequence):
     """Calculate the Golden Ratio approximation from the sequence"""
     if len(sequence) < 2:
@@ -61,46 +373,116 @@ def golden_ratio_approximation(sequence):
 
     return sequence[-1] / sequence[-2]
 
+def golden_ratio_decimal(precision=50):
+    """The golden ratio (1 + sqrt(5)) / 2 as a Decimal with precision significant digits"""
+    with localcontext() as ctx:
+        ctx.prec = precision + GUARD_DIGITS
+        phi = (1 + Decimal(5).sqrt()) / 2
+        ctx.prec = precision
+        return +phi
+
+def golden_ratio_convergence(k, precision=50):
+    """Return (F(k+1) / F(k), |F(k+1) / F(k) - phi|) as Decimals, or None for k < 1
+
+    Both values carry precision significant digits for any k. The error uses the
+    identity F(k+1) - phi * F(k) = psi^k with |psi| = 1 / phi, i.e. error = 1 / (phi^k F(k)),
+    so it never loses digits to cancellation and never overflows.
+    """
+    if k < 1:
+        return None
+
+    previous, last = fib_cache.pair(k)
+    with localcontext() as ctx:
+        ctx.prec = precision + GUARD_DIGITS
+        ctx.Emax, ctx.Emin = MAX_EMAX, MIN_EMIN
+        phi = (1 + Decimal(5).sqrt()) / 2
+        ratio = Decimal(last) / Decimal(previous)
+        error = 1 / (phi ** k * Decimal(previous))
+        ctx.prec = precision
+        return +ratio, +error
+
+def golden_ratio_error_report(start, stop, precision=30):
+    """List (k, ratio, error) for every k in range(start, stop) in one pass
+
+    Starts from one fast-doubling pair, then advances the terms and phi^k
+    incrementally instead of recomputing each index from scratch.
+    """
+    start = max(start, 1)
+    if stop <= start:
+        return []
+
+    report = []
+    previous, last = fib_cache.pair(start)
+    with localcontext() as ctx:
+        # Enough guard digits to absorb rounding from the running product phi^k
+        ctx.prec = precision + GUARD_DIGITS + len(str(stop - start))
+        ctx.Emax, ctx.Emin = MAX_EMAX, MIN_EMIN
+        phi = (1 + Decimal(5).sqrt()) / 2
+        phi_power = phi ** start
+        for k in range(start, stop):
+            ratio = Decimal(last) / Decimal(previous)
+            error = 1 / (phi_power * Decimal(previous))
+            report.append((k, ratio, error))
+            previous, last = last, previous + last
+            phi_power *= phi
+        ctx.prec = precision
+        return [(k, +ratio, +error) for k, ratio, error in report]
+
 def main():
     """Main function with improved input validation and error handling"""
     try:
         # Input validation with try-except
         n = int(input("Enter the number of terms in the Fibonacci sequence: "))
 
+        # Terms of huge sequences run past Python's default int-to-str digit limit
+        if hasattr(sys, 'set_int_max_str_digits'):
+            sys.set_int_max_str_digits(0)
+
         if n < 1:
             print("Please enter a positive integer.")
             return
 
+        choice = input("\nChoose your output: ASCII (a), Plot (p), Golden Ratio (g), Last term (t): ").lower()
+
+        # Golden ratio and last term only need two terms, so skip the full sequence
+        if choice == 'g':
+            convergence = golden_ratio_convergence(n - 2, precision=30)
+            if convergence is None:
+                print("Cannot calculate golden ratio approximation for sequences with less than 2 terms or containing zeros.")
+            else:
+                ratio, error = convergence
+                print(f"Golden Ratio Approximation: {ratio}")
+                print(f"Actual Golden Ratio: {golden_ratio_decimal(30)}")
+                print(f"Difference: {error:.10E}")
+            return
+        elif choice == 't':
+            print(f"F({n - 1}) = {fib(n - 1)}")
+            return
+        elif choice not in ('a', 'p'):
+            print("Invalid choice. Please select 'a' for ASCII, 'p' for Plot, 'g' for Golden Ratio, or 't' for Last term.")
+            return
+
         if n > 50:
             print("Warning: Large sequences may take time to compute and display.")
             proceed = input("Do you want to continue? (y/n): ").lower()
             if proceed != 'y':
                 return
 
-        fib_sequence = fibonacci(n)
-        print(f"\nGenerated Fibonacci sequence with {len(fib_sequence)} terms:")
-        print(f"Sequence: {fib_sequence}")
-
-        choice = input("\nChoose your visualization method: ASCII (a), Plot (p), Golden Ratio (g): ").lower()
+        # Stream the terms as they are generated instead of building the list first
+        print(f"\nGenerated Fibonacci sequence with {n} terms:")
+        print("Sequence: [", end="")
+        for i, value in enumerate(iter_fibonacci(n)):
+            print(value if i == 0 else f", {value}", end="")
+        print("]")
 
         if choice == 'a':
-            visualize_fibonacci_ascii(fib_sequence)
-        elif choice == 'p':
+            visualize_fibonacci_ascii(iter_fibonacci(n), count=n)
+        else:
             try:
-                plot_fibonacci(fib_sequence)
+                plot_fibonacci_terms(n)
             except Exception as e:
                 print(f"Error creating plot: {e}")
                 print("Make sure matplotlib is installed: pip install matplotlib")
-        elif choice == 'g':
-            ratio = golden_ratio_approximation(fib_sequence)
-            if ratio is None:
-                print("Cannot calculate golden ratio approximation for sequences with less than 2 terms or containing zeros.")
-            else:
-                print(f"Golden Ratio Approximation: {ratio:.10f}")
-                print(f"Actual Golden Ratio: {(1 + math.sqrt(5)) / 2:.10f}")
-                print(f"Difference: {abs(ratio - (1 + math.sqrt(5)) / 2):.10f}")
-        else:
-            print("Invalid choice. Please select 'a' for ASCII, 'p' for Plot, or 'g' for Golden Ratio.")
 
     except ValueError:
         print("Invalid input. Please enter a valid integer.")
@@ -0,0 +1,182 @@
+import contextlib
+import io
+import math
+import random
+from decimal import Decimal, localcontext
+
+import numpy as np
+import pytest
+from src import epicFibonacci
+from src.epicFibonacci import (EXACT_LOG_LIMIT, FibonacciCache, decimate_minmax, fib, fib_mod, fib_mod_batch,
+                               fib_pair, fibonacci, fibonacci_log10_terms, golden_ratio_convergence,
+                               golden_ratio_error_report, iter_fibonacci, pisano_period,
+                               visualize_fibonacci_ascii)
+
+# Reference terms F(0) .. F(10000) by plain addition
+TERMS = list(iter_fibonacci(10002))
+
+
+def test_fibonacci_matches_iter_fibonacci():
+    assert fibonacci(0) == []
+    assert fibonacci(10) == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+    assert fibonacci(len(TERMS)) == TERMS
+
+
+@pytest.mark.parametrize("n", [*range(20), 63, 64, 65, 127, 128, 129, 1000, 4097, 10000])
+def test_fib_pair_and_fib_match_sequence(n):
+    assert fib_pair(n) == (TERMS[n], TERMS[n + 1])
+    assert fib(n) == TERMS[n]
+
+
+def test_fib_pair_rejects_negative():
+    with pytest.raises(ValueError):
+        fib_pair(-1)
+
+
+def test_fibonacci_cache_extends_across_step_limit():
+    cache = FibonacciCache(step_limit=64, combine_ratio=8)
+    # Gaps of up to step_limit are walked term by term, gaps of up to
+    # base // 8 are combined with the checkpoint, and farther ones start over
+    queries = [1000, 1000 + 64, 1064 + 65, 1129 + 1129 // 8, 50, 10000, 9999]
+    for n in queries:
+        assert cache.pair(n) == (TERMS[n], TERMS[n + 1])
+    assert cache.pair(1000) == (TERMS[1000], TERMS[1001])
+    stats = cache.stats()
+    assert (stats["hits"], stats["extensions"], stats["misses"]) == (1, 3, 4)
+
+
+def test_fibonacci_cache_far_query_skips_combine(monkeypatch):
+    cache = FibonacciCache()
+    cache.pair(4000)
+
+    def fail(*args):
+        raise AssertionError("far query extended a distant checkpoint")
+
+    monkeypatch.setattr(epicFibonacci, "combine_pairs", fail)
+    assert cache.pair(4000 + 4000 // 8 + 1) == fib_pair(4501)
+    assert cache.pair(10000) == (TERMS[10000], TERMS[10001])
+    assert cache.stats()["misses"] == 3
+
+
+def brute_force_pisano(m):
+    a, b, period = 0, 1 % m, 0
+    while True:
+        a, b = b, (a + b) % m
+        period += 1
+        if (a, b) == (0, 1 % m):
+            return period
+
+
+def test_pisano_period_matches_brute_force():
+    for m in range(1, 500):
+        assert pisano_period(m) == brute_force_pisano(m), m
+
+
+@pytest.mark.parametrize("moduli", [
+    [10, 10, 10, 97, 97, 1000],   # tabulated moduli
+    [10**9 + 7, 10**11 + 3],      # fast doubling only
+])
+def test_fib_mod_batch_matches_fib_mod(moduli):
+    rng = random.Random(0)
+    queries = [(rng.randrange(10**18), rng.choice(moduli)) for _ in range(2000)]
+    queries += [(0, 1), (1, 1), (0, 7), (1, 7)]
+    assert fib_mod_batch(queries) == [fib_mod(n, m) for n, m in queries]
+    # Invalid queries are rejected whether or not their modulus is tabulated
+    for m in moduli:
+        with pytest.raises(ValueError):
+            fib_mod_batch(queries + [(-1, m)])
+        with pytest.raises(ValueError):
+            fib_mod_batch([(-1, m)])
+    with pytest.raises(ValueError):
+        fib_mod_batch(queries + [(5, 0)])
+
+
+def test_fibonacci_cache_bits_count_both_terms():
+    cache = FibonacciCache(max_bits=20000)
+    for n in range(1000, 20000, 1000):
+        assert cache.pair(n) == fib_pair(n)
+    entries = cache._pairs.values()
+    assert cache.stats()["bits"] == sum(a.bit_length() + b.bit_length() for a, b in entries)
+    assert cache.stats()["bits"] <= cache.max_bits
+
+
+def direct_ratio_error(k, precision):
+    """F(k+1) / F(k) and its distance from phi, with enough digits to survive the cancellation"""
+    with localcontext() as ctx:
+        # The error is about phi^(-2k), so carry 2k * log10(phi) extra digits
+        ctx.prec = precision + 10 + int(0.42 * k)
+        phi = (1 + Decimal(5).sqrt()) / 2
+        ratio = Decimal(TERMS[k + 1]) / Decimal(TERMS[k])
+        return ratio, abs(ratio - phi)
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 10, 100, 1000, 5000])
+def test_golden_ratio_convergence_matches_direct_decimal(k):
+    ratio, error = golden_ratio_convergence(k, precision=30)
+    direct_ratio, direct_error = direct_ratio_error(k, 30)
+    assert abs(ratio - direct_ratio) <= direct_ratio * Decimal("1e-29")
+    assert abs(error - direct_error) <= direct_error * Decimal("1e-28")
+
+
+def test_golden_ratio_convergence_needs_k_of_at_least_one():
+    assert golden_ratio_convergence(0) is None
+
+
+def test_golden_ratio_error_report_matches_convergence():
+    report = golden_ratio_error_report(0, 300, precision=30)
+    assert [k for k, _, _ in report] == list(range(1, 300))
+    for k, ratio, error in report:
+        expected_ratio, expected_error = golden_ratio_convergence(k, precision=30)
+        assert abs(ratio - expected_ratio) <= expected_ratio * Decimal("1e-29")
+        assert abs(error - expected_error) <= expected_error * Decimal("1e-28")
+    assert golden_ratio_error_report(10, 10) == []
+
+
+def ascii_output(*args, **kwargs):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        visualize_fibonacci_ascii(*args, **kwargs)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("count", [
+    0, 1, 2,
+    12,        # largest term 89: linear scale
+    13, 40,    # logarithmic scale from exact terms
+    71, 200,   # past EXACT_LOG_LIMIT, where the streamed path switches to the closed form
+])
+def test_streamed_ascii_matches_list(count):
+    expected = ascii_output(fibonacci(count))
+    assert ascii_output(iter_fibonacci(count), count=count) == expected
+    if count >= 12:
+        assert expected.count("\n") == count + 3
+
+
+def test_decimate_minmax_short_input_unchanged():
+    values = np.arange(10.0)
+    x, y = decimate_minmax(values, buckets=5)
+    assert x.tolist() == list(range(10))
+    assert y is values
+
+
+@pytest.mark.parametrize("n,buckets", [(1000, 7), (10007, 100), (4001, 2000)])
+def test_decimate_minmax_keeps_bucket_extremes(n, buckets):
+    values = np.random.default_rng(n).standard_normal(n)
+    x, y = decimate_minmax(values, buckets)
+    assert len(x) == len(y) == 2 * buckets
+    assert (x[0], x[-1]) == (0, n - 1)
+    starts, ends = x[::2], x[1::2]
+    # Buckets tile the input exactly, in order
+    assert starts[0] == 0 and np.array_equal(starts[1:], ends[:-1] + 1)
+    for start, end, low, high in zip(starts, ends, y[::2], y[1::2]):
+        assert low == values[start:end + 1].min()
+        assert high == values[start:end + 1].max()
+    assert y.min() == values.min() and y.max() == values.max()
+
+
+def test_fibonacci_log10_terms_across_closed_form_switch():
+    n = 2 * EXACT_LOG_LIMIT
+    values = fibonacci_log10_terms(n)
+    expected = [math.log10(TERMS[k] + 1) for k in range(n)]
+    assert values[:EXACT_LOG_LIMIT + 1].tolist() == expected[:EXACT_LOG_LIMIT + 1]
+    np.testing.assert_allclose(values, expected, rtol=1e-13)
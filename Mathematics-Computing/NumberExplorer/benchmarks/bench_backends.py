@@ -0,0 +1,58 @@
+"""
+Time explore_odd for each executor backend across worker counts.
+
+Run from the NumberExplorer directory:
+    python benchmarks/bench_backends.py --start 1000000000 --span 20000000
+
+The process backend should scale close to linearly up to the number of
+cores; the thread backend stays flat because the scan holds the GIL.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.odd import BACKENDS, explore_odd  # noqa: E402
+
+
+def time_backend(start, end, backend, workers):
+    """
+    Return (seconds, candidate count) for one explore_odd run.
+    """
+    t0 = time.perf_counter()
+    results = explore_odd(start, end, workers=workers, backend=backend)
+    return time.perf_counter() - t0, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--start', type=int, default=10**9)
+    parser.add_argument('--span', type=int, default=10**7)
+    parser.add_argument(
+        '--max-workers', type=int, default=os.cpu_count() or 1
+    )
+    args = parser.parse_args()
+    end = args.start + args.span - 1
+
+    serial_time, expected = time_backend(args.start, end, 'serial', 1)
+    print(f'{"backend":<8} {"workers":>7} {"seconds":>9} {"speedup":>8}')
+    print(f'{"serial":<8} {1:>7} {serial_time:>9.3f} {1.0:>8.2f}')
+    worker_counts = sorted({1, 2, 4, args.max_workers} - {0})
+    for backend in BACKENDS:
+        if backend == 'serial':
+            continue
+        for workers in worker_counts:
+            if workers > args.max_workers:
+                continue
+            seconds, found = time_backend(args.start, end, backend, workers)
+            assert found == expected, 'backends disagree on candidates'
+            print(
+                f'{backend:<8} {workers:>7} {seconds:>9.3f} '
+                f'{serial_time / seconds:>8.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
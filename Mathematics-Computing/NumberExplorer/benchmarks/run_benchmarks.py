@@ -0,0 +1,277 @@
+"""
+Benchmark suite for the NumberExplorer hot paths.
+
+Times basic_conditions, prime_factor_filters, explore_odd (per backend and
+worker count), generate_perfect and validate_perfect at several input sizes,
+plus CLI startup time, and writes the results as JSON, tagged with the
+current git commit.
+
+Run from the NumberExplorer directory:
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --quick --compare bench.json
+
+--compare reports cases that got slower than a previous results file and
+exits with status 1 if any slowed down by more than --threshold.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from src.even import generate_perfect, is_mersenne_prime, validate_perfect  # noqa: E402
+from src.odd import (BACKENDS, basic_conditions, basic_conditions_block,  # noqa: E402
+                     explore_odd, prime_factor_filters)
+from src.sieve import (factorint_with_spf, primes_up_to,  # noqa: E402
+                       smallest_prime_factors)
+
+
+def measure(fn, repeats, setup=None):
+    """
+    Run fn repeats times and return the wall-clock seconds of each run.
+    setup, if given, runs untimed before every repetition.
+    """
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def record(name, params, timings, items=None):
+    """
+    Summarize timings as a JSON-ready result. items is the amount of work
+    per run (numbers scanned, values checked) used for a throughput figure.
+    """
+    best = min(timings)
+    result = {
+        'name': name,
+        'params': params,
+        'repeats': len(timings),
+        'min_seconds': best,
+        'median_seconds': statistics.median(timings),
+    }
+    if items:
+        result['items_per_second'] = items / best if best else None
+    return result
+
+
+def bench_basic_conditions(sizes, repeats):
+    basic_conditions_block(1, 2)  # build the cached residue table untimed
+    for size in sizes:
+        start = 10**9
+        yield record(
+            'basic_conditions', {'size': size},
+            measure(lambda: [basic_conditions(n) for n in range(start, start + size)], repeats),
+            items=size,
+        )
+        yield record(
+            'basic_conditions_block', {'size': size},
+            measure(lambda: basic_conditions_block(start, start + size), repeats),
+            items=size,
+        )
+
+
+def bench_prime_factor_filters(magnitudes, count, repeats):
+    for magnitude in magnitudes:
+        start = 10**magnitude + 1
+        numbers = list(range(start, start + 2 * count, 2))
+        yield record(
+            'prime_factor_filters', {'magnitude': magnitude, 'count': count, 'path': 'sympy'},
+            measure(lambda: [prime_factor_filters(n) for n in numbers], repeats),
+            items=count,
+        )
+
+        def sieved():
+            primes = primes_up_to(int((start + 2 * count) ** 0.5) + 1).tolist()
+            spf = smallest_prime_factors(start, start + 2 * count, primes)
+            for n in numbers:
+                prime_factor_filters(n, factorint_with_spf(n, int(spf[n - start]), primes))
+
+        yield record(
+            'prime_factor_filters', {'magnitude': magnitude, 'count': count, 'path': 'sieve'},
+            measure(sieved, repeats),
+            items=count,
+        )
+
+
+def bench_explore_odd(spans, worker_counts, repeats):
+    start = 10**9
+    for span in spans:
+        end = start + span - 1
+        for backend in BACKENDS:
+            for workers in ([1] if backend == 'serial' else worker_counts):
+                yield record(
+                    'explore_odd',
+                    {'span': span, 'backend': backend, 'workers': workers},
+                    measure(lambda: explore_odd(start, end, workers=workers, backend=backend), repeats),
+                    items=span,
+                )
+
+
+def bench_generate_perfect(exponents, repeats):
+    for p_max in exponents:
+        yield record(
+            'generate_perfect', {'p_max': p_max},
+            measure(lambda: generate_perfect(p_max), repeats, setup=is_mersenne_prime.cache_clear),
+        )
+
+
+def bench_validate_perfect(exponents, repeats):
+    for p_max in exponents:
+        perfects = [n for _, n in generate_perfect(p_max)]
+
+        def validate_all():
+            for n in perfects:
+                validate_perfect(n)
+
+        # Warm: Mersenne results cached by generate_perfect, as in main.py
+        yield record(
+            'validate_perfect', {'p_max': p_max, 'cache': 'warm'},
+            measure(validate_all, repeats, setup=lambda: generate_perfect(p_max)),
+            items=len(perfects),
+        )
+        yield record(
+            'validate_perfect', {'p_max': p_max, 'cache': 'cold'},
+            measure(validate_all, repeats, setup=is_mersenne_prime.cache_clear),
+            items=len(perfects),
+        )
+
+
+def bench_startup(commands, repeats):
+    """
+    Wall time of fresh interpreter runs of main.py, which holds the lazy
+    import gain: --help must not load NumPy, sympy or matplotlib.
+    """
+    main_py = os.path.join(ROOT, 'src', 'main.py')
+    for argv in commands:
+        yield record(
+            'startup', {'argv': ' '.join(argv)},
+            measure(lambda: subprocess.run(
+                [sys.executable, main_py, *argv], stdout=subprocess.DEVNULL, check=True
+            ), repeats),
+        )
+
+
+def git_commit():
+    """
+    Current git commit hash, or None outside a git checkout.
+    """
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def case_key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+
+def compare(results, baseline, threshold):
+    """
+    Print each case's slowdown against baseline results.
+    Returns the number of cases slower than threshold times the baseline.
+    """
+    previous = {case_key(r): r for r in baseline['results']}
+    regressions = 0
+    for result in results:
+        old = previous.get(case_key(result))
+        if not old or not old['min_seconds']:
+            continue
+        ratio = result['min_seconds'] / old['min_seconds']
+        flag = ''
+        if ratio > threshold:
+            regressions += 1
+            flag = '  REGRESSION'
+        print(
+            f"{result['name']:<22} {json.dumps(result['params'], sort_keys=True):<60} "
+            f"{ratio:6.2f}x{flag}",
+            file=sys.stderr
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', type=str, help='Write JSON results to this file')
+    parser.add_argument('--quick', action='store_true', help='Smaller sizes for a fast check')
+    parser.add_argument('--repeats', '-r', type=int, default=3)
+    parser.add_argument('--compare', type=str, help='Previous results file to compare against')
+    parser.add_argument(
+        '--threshold', type=float, default=1.25,
+        help='Slowdown ratio reported as a regression (default 1.25)'
+    )
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cpus})
+    if args.quick:
+        cases = [
+            bench_basic_conditions([10**4, 10**5], args.repeats),
+            bench_prime_factor_filters([6, 9], 200, args.repeats),
+            bench_explore_odd([10**6], worker_counts, args.repeats),
+            bench_generate_perfect([127, 607], args.repeats),
+            bench_validate_perfect([127, 607], args.repeats),
+            bench_startup([['--help']], args.repeats),
+        ]
+    else:
+        cases = [
+            bench_basic_conditions([10**4, 10**5, 10**6], args.repeats),
+            bench_prime_factor_filters([6, 9, 12], 1000, args.repeats),
+            bench_explore_odd([10**6, 10**7], worker_counts, args.repeats),
+            bench_generate_perfect([127, 607, 1279, 2281], args.repeats),
+            bench_validate_perfect([127, 607, 1279, 2281], args.repeats),
+            bench_startup([['--help'], ['even', '-m', '31']], args.repeats),
+        ]
+
+    results = []
+    for case in cases:
+        for result in case:
+            print(
+                f"{result['name']:<22} {json.dumps(result['params'], sort_keys=True):<60} "
+                f"{result['min_seconds']:.4f}s",
+                file=sys.stderr
+            )
+            results.append(result)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': cpus,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {baseline.get('commit')}:", file=sys.stderr)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,69 @@
-import sympy
+import math
 import os # Import os module
+from functools import lru_cache
+
+# Largest trial divisor tried on a Mersenne number before Lucas–Lehmer
+TRIAL_FACTOR_LIMIT = 1 << 20
+
+
+def prime_exponents(p_max):
+    """
+    Return the primes <= p_max; 2^p - 1 can only be prime for prime p.
+    """
+    if p_max < 2:
+        return []
+    sieve = bytearray([1]) * (p_max + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, math.isqrt(p_max) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, p_max + 1, p)))
+    return [p for p in range(2, p_max + 1) if sieve[p]]
+
+
+def has_small_mersenne_factor(p):
+    """
+    Trial-divide 2^p - 1 (p an odd prime) by candidates up to TRIAL_FACTOR_LIMIT.
+    Any factor q has the form 2kp + 1 with q = ±1 (mod 8), so few need testing.
+    """
+    mersenne = (1 << p) - 1
+    q = 2 * p + 1
+    while q <= TRIAL_FACTOR_LIMIT and q * q <= mersenne:
+        if q % 8 in (1, 7) and pow(2, p, q) == 1:
+            return True
+        q += 2 * p
+    return False
+
+
+def lucas_lehmer(p):
+    """
+    Lucas–Lehmer test: True if 2^p - 1 is prime, for prime exponent p.
+    Squares are reduced mod 2^p - 1 with shifts and masks instead of
+    division, since 2^p = 1 (mod 2^p - 1).
+    """
+    if p == 2:
+        return True
+    mersenne = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        # Adding the modulus keeps s non-negative without changing the residue
+        s = s * s + mersenne - 2
+        s = (s & mersenne) + (s >> p)
+        while s >= mersenne:
+            s -= mersenne
+    return s == 0
+
+
+@lru_cache(maxsize=None)
+def is_mersenne_prime(p):
+    """
+    True if 2^p - 1 is prime. p is screened for primality and small
+    factors first; only survivors pay for the Lucas–Lehmer test.
+    """
+    if p < 2 or any(p % d == 0 for d in range(2, math.isqrt(p) + 1)):
+        return False
+    if p > 2 and has_small_mersenne_factor(p):
+        return False
+    return lucas_lehmer(p)
 
 
 def generate_perfect(p_max):
@@ -8,36 +72,69 @@ def generate_perfect(p_max):
     Returns a list of tuples (p, perfect_number).
     """
     perfects = []
-    for p in range(2, p_max + 1):
-        mersenne = (1 << p) - 1
-        if sympy.isprime(mersenne):
+    for p in prime_exponents(p_max):
+        if is_mersenne_prime(p):
+            mersenne = (1 << p) - 1
             perfect = (1 << (p - 1)) * mersenne
             perfects.append((p, perfect))
     return perfects
 
 
-def validate_perfect(n):
+def sigma(factors):
+    """
+    Sum of divisors of n from its {prime: exponent} factorization.
+    """
+    total = 1
+    for p, e in factors.items():
+        total *= (p ** (e + 1) - 1) // (p - 1)
+    return total
+
+
+def euclid_euler_exponent(n):
+    """
+    Return p if n == 2^(p-1) * (2^p - 1), otherwise None.
+    """
+    if n < 2 or n & 1:
+        return None
+    k = (n & -n).bit_length() - 1  # exponent of the largest power of 2 dividing n
+    if n >> k != (1 << (k + 1)) - 1:
+        return None
+    return k + 1
+
+
+def validate_perfect(n, factors=None):
     """
-    Validate n is a perfect number by checking sum of proper divisors equals n.
+    Validate n is a perfect number by checking sigma(n) == 2n.
+    Even perfect numbers all have the form 2^(p-1) * (2^p - 1) with
+    2^p - 1 prime, so even n is checked against that shape and the
+    cached Mersenne test instead of being factored. Otherwise sigma is
+    computed from factors (or sympy.factorint) without listing divisors.
     """
     if n < 2:
         return False
-    return sympy.divisors(n)[:-1] and sum(sympy.divisors(n)) - n == n
+    if factors is None:
+        if n % 2 == 0:
+            p = euclid_euler_exponent(n)
+            return p is not None and is_mersenne_prime(p)
+        import sympy  # only needed for odd n; keeps the even path sympy-free
+        factors = sympy.factorint(n)
+    return sigma(factors) == 2 * n
 
 
 def plot_perfects(perfects, show=True, save_path=None):
     """
-    Plot perfect numbers growth: exponents vs values on log scale.
+    Plot perfect numbers growth: exponents vs log10 of the values.
     Only calls plt.show() if show is True.
     Creates the directory for save_path if it doesn't exist.
     """
     import matplotlib.pyplot as plt
     exponents, values = zip(*perfects) if perfects else ([], [])
+    # math.log10 handles big ints that would overflow a float conversion
+    digits = [math.log10(v) for v in values]
     plt.figure()
-    plt.plot(exponents, values, 'o-')
-    plt.yscale('log')
+    plt.plot(exponents, digits, 'o-')
     plt.xlabel('Exponent p')
-    plt.ylabel('Perfect number (log scale)')
+    plt.ylabel('log10(Perfect number)')
     plt.title('Even Perfect Numbers')
     if save_path:
         # Ensure the directory exists before saving
@@ -1,11 +1,21 @@
 import argparse
+import json
 import sys
 
-from even import generate_perfect, validate_perfect, plot_perfects
-from odd import explore_odd, plot_filters
+# odd and sieve import NumPy at module level, so they are imported only once
+# the odd subcommand runs; --help stays fast. even is cheap to import (it
+# loads sympy and matplotlib itself, only when needed) and is deferred too.
+# These mirror odd.BACKENDS, odd.MAX_END and sieve.DEFAULT_BLOCK_SIZE for the
+# same reason.
+BACKENDS = ('thread', 'process', 'serial')
+MAX_END = 10**15
+DEFAULT_BLOCK_SIZE = 1 << 18
 
 
-def main():
+def build_parser():
+    """
+    Build the numberexplorer argument parser.
+    """
     parser = argparse.ArgumentParser(
         prog='numberexplorer',
         description='Explore even and odd perfect numbers'
@@ -16,7 +26,7 @@ def main():
     even_parser = subparsers.add_parser('even', help='Generate even perfect numbers')
     even_parser.add_argument(
         '--max-exponent', '-m', type=int, required=True,
-        help='Maximum exponent p to test (<=31)' # Wrap help string
+        help='Maximum exponent p to test (>=2)'
     )
     even_parser.add_argument(
         '--plot', action='store_true', 
@@ -37,11 +47,35 @@ def main():
     )
     odd_parser.add_argument(
         '--end', '-e', type=int, required=True, 
-        help='End of range'
+        help=f'End of range (at most {MAX_END:.0e})'
     )
     odd_parser.add_argument(
         '--workers', '-w', type=int, default=4, 
-        help='Number of threads'
+        help='Number of worker threads or processes'
+    )
+    odd_parser.add_argument(
+        '--backend', '-b', choices=BACKENDS, default='thread',
+        help='Executor for sieve blocks (process scales across cores)'
+    )
+    odd_parser.add_argument(
+        '--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+        help='Numbers sieved per block (bounds memory use)'
+    )
+    odd_parser.add_argument(
+        '--cache-dir', type=str,
+        help='Directory for cached sieve blocks reused across runs'
+    )
+    odd_parser.add_argument(
+        '--checkpoint', type=str,
+        help='JSON file recording progress; rerun to resume after a crash'
+    )
+    odd_parser.add_argument(
+        '--jsonl', type=str,
+        help='Append candidates and per-block statistics to this JSONL file'
+    )
+    odd_parser.add_argument(
+        '--progress', action='store_true',
+        help='Report each finished block on stderr'
     )
     odd_parser.add_argument(
         '--plot', action='store_true', 
@@ -51,14 +85,22 @@ def main():
         '--save', type=str, 
         help='Path to save the plot image'
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    args = build_parser().parse_args()
 
     if args.command == 'even':
+        from even import generate_perfect, validate_perfect, plot_perfects
+
         p_max = args.max_exponent
-        if p_max < 2 or p_max > 31:
-            print('max-exponent must be between 2 and 31', file=sys.stderr)
+        if p_max < 2:
+            print('max-exponent must be at least 2', file=sys.stderr)
             sys.exit(1)
+        # Perfect numbers for large p run to thousands of digits
+        if hasattr(sys, 'set_int_max_str_digits'):
+            sys.set_int_max_str_digits(0)
         perfects = generate_perfect(p_max)
         for p, val in perfects:
             print(f'p={p} -> {val}')
@@ -74,20 +116,69 @@ def main():
             plot_perfects(perfects, show=show_plot, save_path=save_plot_path)
 
     elif args.command == 'odd':
+        from odd import (block_records, block_throughput, iter_odd,
+                         load_checkpoint, plot_filters)
+
         start, end = args.start, args.end
-        # Wrap long condition
-        if start < 1 or end < start or end > 10**6:
-            print(
-                'Invalid range. Ensure 1 <= start <= end <= 1e6',
-                file=sys.stderr
-            )
+        if start < 1 or end < start:
+            print('Invalid range. Ensure 1 <= start <= end', file=sys.stderr)
+            sys.exit(1)
+        if end > MAX_END:
+            # The sieving primes up to sqrt(end) would take gigabytes beyond this
+            print(f'Invalid range. end must be at most {MAX_END:.0e}', file=sys.stderr)
+            sys.exit(1)
+        if args.block_size < 1 or args.workers < 1:
+            print('block-size and workers must be positive', file=sys.stderr)
             sys.exit(1)
-        results = explore_odd(start, end, workers=args.workers)
-        if results:
-            print('Candidates:')
-            for n, reason in results:
-                print(f'{n}: {reason}')
-        else:
+        if args.checkpoint:
+            try:
+                resume = load_checkpoint(args.checkpoint, start, end, args.block_size)
+            except ValueError as e:
+                print(e, file=sys.stderr)
+                sys.exit(1)
+            if resume > end:
+                print(f'Checkpoint {args.checkpoint} is already complete: '
+                      f'{start}-{end} was fully scanned')
+                return
+        # Only keep candidates in memory when a plot needs them
+        keep_results = args.plot or args.save
+        results = []
+        found = 0
+        try:
+            jsonl = open(args.jsonl, 'a') if args.jsonl else None
+        except OSError as e:
+            print(f'Cannot open JSONL file: {e}', file=sys.stderr)
+            sys.exit(1)
+        try:
+            blocks = iter_odd(
+                start, end, workers=args.workers, block_size=args.block_size,
+                backend=args.backend, cache_dir=args.cache_dir,
+                checkpoint=args.checkpoint
+            )
+            for block in blocks:
+                for n, reason in block.candidates:
+                    if not found:
+                        print('Candidates:')
+                    found += 1
+                    print(f'{n}: {reason}')
+                if jsonl:
+                    for record in block_records(block):
+                        jsonl.write(json.dumps(record) + '\n')
+                    # Flush before the checkpoint advances past this block
+                    jsonl.flush()
+                if args.progress:
+                    print(
+                        f'Scanned {block.lo}-{block.hi - 1}: '
+                        f'{len(block.candidates)} candidates, '
+                        f'{block_throughput(block):,.0f} numbers/s',
+                        file=sys.stderr
+                    )
+                if keep_results:
+                    results.extend(block.candidates)
+        finally:
+            if jsonl:
+                jsonl.close()
+        if not found:
             print('No candidates found')
         # Determine if plot should be shown or saved
         show_plot = args.plot
@@ -1,8 +1,35 @@
 import concurrent.futures
-import sympy
-from math import gcd
+import json
+import time
+from collections import deque, namedtuple
+from functools import lru_cache
+from math import gcd, isqrt
 import os # Import os module
 
+import numpy as np
+
+try:
+    from .sieve import (DEFAULT_BLOCK_SIZE, FactorStore, block_bounds,
+                        factorint_with_spf, primes_up_to, smallest_prime_factors)
+except ImportError:
+    from sieve import (DEFAULT_BLOCK_SIZE, FactorStore, block_bounds,
+                       factorint_with_spf, primes_up_to, smallest_prime_factors)
+
+# Smallest prime factor an odd perfect number candidate may have
+MIN_PRIME_FACTOR = 10**4
+CANDIDATE_REASON = "Passes basic and prime-factor filters"
+# basic_conditions depends only on n modulo lcm(105, 12, 468, 324)
+BASIC_CONDITIONS_PERIOD = 147420
+# Executor modes accepted by explore_odd
+BACKENDS = ('thread', 'process', 'serial')
+# Largest range end accepted. Every worker sieves with all primes up to
+# sqrt(end): about 1.9 million of them here, tens of MB per worker, and
+# growing with sqrt(end) beyond it.
+MAX_END = 10**15
+
+# One finished sieve block: bounds [lo, hi), its candidates and scan time
+BlockResult = namedtuple('BlockResult', ['lo', 'hi', 'candidates', 'seconds'])
+
 
 def basic_conditions(n):
     """
@@ -14,38 +41,245 @@ def basic_conditions(n):
     return n % 105 != 0 and (n % 12 == 1 or n % 468 == 117 or n % 324 == 81)
 
 
-def prime_factor_filters(n):
+def basic_conditions_mask(numbers):
+    """
+    Vectorized basic_conditions over a NumPy integer array.
+    Returns a boolean array, True where the number passes.
+    """
+    return (
+        (numbers > 1)
+        & (numbers % 105 != 0)
+        & ((numbers % 12 == 1) | (numbers % 468 == 117) | (numbers % 324 == 81))
+    )
+
+
+@lru_cache(maxsize=1)
+def _basic_conditions_pattern():
+    """
+    basic_conditions for one full period of residues, indexed by n % period.
+    """
+    period = BASIC_CONDITIONS_PERIOD
+    # Evaluate on [period, 2 * period) so the n > 1 test never masks a residue
+    pattern = basic_conditions_mask(np.arange(period, 2 * period, dtype=np.int64))
+    pattern.flags.writeable = False
+    return pattern
+
+
+def basic_conditions_block(lo, hi):
+    """
+    basic_conditions for every integer in [lo, hi) as a boolean array.
+    Equivalent to basic_conditions_mask(np.arange(lo, hi)) but tiles a
+    precomputed period instead of taking four modulos per number.
+    """
+    pattern = np.roll(_basic_conditions_pattern(), -(lo % BASIC_CONDITIONS_PERIOD))
+    mask = np.resize(pattern, hi - lo)
+    mask[:max(0, 2 - lo)] = False  # 0 and 1 are never candidates
+    return mask
+
+
+def prime_factor_filters(n, factors=None, store=None):
     """
     Analyze prime factors of n for odd perfect number criteria.
+    factors may be a precomputed {prime: exponent} factorization of n
+    (e.g. from the block sieve). Otherwise n is factored through store,
+    a FactorStore that is filled in as needed, or sympy.factorint.
     Returns True if filters pass.
     """
-    factors = sympy.factorint(n)
-    primes = list(factors.keys())
-    if len(primes) < 2 or primes[0] < 10**4:
+    if factors is None:
+        if store is not None:
+            factors = store.factorint(n)
+        else:
+            import sympy  # the sieve paths never need it
+            factors = sympy.factorint(n)
+    # sympy.factorint does not guarantee ascending key order
+    primes = sorted(factors)
+    if len(primes) < 2 or primes[0] < MIN_PRIME_FACTOR:
         return False
     if any(p < 100 for p in primes[:3]) or gcd(n, sum(primes)) > 1:
         return False
     return True
 
 
-def explore_odd(start, end, workers=4):
+def scan_block(lo, hi, primes, store=None):
     """
-    Explore range for potential odd perfect number candidates.
+    Find candidates in the half-open block [lo, hi).
+    basic_conditions is applied to the whole block as an array mask, the
+    block is factored at once with a smallest-prime-factor sieve, and
+    only numbers passing both reach per-number factoring.
+    primes must be an ascending list of every prime <= sqrt(hi - 1).
+    With a FactorStore the sieve table is read from (or added to) the cache.
     Returns list of (n, reason) for candidates.
     """
+    survivors = basic_conditions_block(lo, hi)
+    if not survivors.any():
+        return []
+    if store is not None:
+        spf = store.smallest_prime_factors(lo, hi)
+    else:
+        spf = smallest_prime_factors(lo, hi, primes)
+    # Anything with a prime factor below MIN_PRIME_FACTOR fails the
+    # prime-factor filters, and primes (spf 0) have a single factor.
+    survivors &= spf >= MIN_PRIME_FACTOR
     candidates = []
+    for offset in np.flatnonzero(survivors).tolist():
+        n = lo + offset
+        factors = factorint_with_spf(n, int(spf[offset]), primes)
+        if prime_factor_filters(n, factors):
+            candidates.append((n, CANDIDATE_REASON))
+    return candidates
+
+
+@lru_cache(maxsize=4)
+def _sieving_primes(limit):
+    """
+    Primes <= limit as a list, computed once per process.
+    """
+    return primes_up_to(limit).tolist()
+
+
+def _scan_block_task(lo, hi, prime_limit, store=None):
+    """
+    Picklable wrapper around scan_block for executor workers.
+    Each worker builds its own sieving primes instead of receiving them.
+    Returns a BlockResult timed inside the worker.
+    """
+    t0 = time.perf_counter()
+    candidates = scan_block(lo, hi, _sieving_primes(prime_limit), store)
+    return BlockResult(lo, hi, candidates, time.perf_counter() - t0)
+
 
-    def check(n):
-        if not basic_conditions(n):
-            return None
-        if not prime_factor_filters(n):
-            return None
-        return (n, "Passes basic and prime-factor filters")
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
-        for result in ex.map(check, range(start, end+1)):
-            if result:
-                candidates.append(result)
+def load_checkpoint(path, start, end, block_size):
+    """
+    Return the number to resume a scan of [start, end] from.
+    Returns start if there is no checkpoint at path; raises ValueError
+    if the checkpoint is malformed or belongs to a different range or
+    block size. A result above end means the scan already finished.
+    """
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return start
+    try:
+        recorded = (state['start'], state['end'], state['block_size'])
+        next_n = state['next']
+    except (KeyError, TypeError):
+        raise ValueError(f"checkpoint {path} is not a scan checkpoint") from None
+    if recorded != (start, end, block_size):
+        raise ValueError(
+            f"checkpoint {path} is for range {recorded[0]}-{recorded[1]} "
+            f"with block size {recorded[2]}"
+        )
+    return next_n
+
+
+def save_checkpoint(path, start, end, block_size, next_n):
+    """
+    Record that every number below next_n in [start, end] has been scanned.
+    Written to a temporary file and renamed so a crash never leaves half a file.
+    """
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(
+            {'start': start, 'end': end, 'block_size': block_size, 'next': next_n}, f
+        )
+    os.replace(tmp_path, path)
+
+
+def iter_odd(start, end, workers=4, block_size=DEFAULT_BLOCK_SIZE,
+             backend='thread', cache_dir=None, checkpoint=None):
+    """
+    Stream the odd scan of [start, end] block by block.
+    Yields a BlockResult for each block in ascending order as soon as it
+    (and every block before it) has finished. With checkpoint, a JSON
+    file path, progress is saved after each yielded block is consumed
+    and a rerun with the same arguments resumes after the last one.
+    Arguments otherwise match explore_odd.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}")
+    if end > MAX_END:
+        raise ValueError(f"end must be at most {MAX_END:.0e}")
+    resume = start
+    if checkpoint:
+        resume = load_checkpoint(checkpoint, start, end, block_size)
+    prime_limit = isqrt(max(end, 0))
+    store = FactorStore(cache_dir, block_size) if cache_dir else None
+    # 0, 1 and negatives are never candidates and the sieve needs n >= 1, so
+    # scanning starts at 2; the checkpoint stays keyed on the caller's start
+    blocks = block_bounds(max(resume, 2), end, block_size)
+
+    def finished(result):
+        yield result
+        if checkpoint:
+            save_checkpoint(checkpoint, start, end, block_size, result.hi)
+
+    if backend == 'serial':
+        for lo, hi in blocks:
+            yield from finished(_scan_block_task(lo, hi, prime_limit, store))
+        return
+
+    if backend == 'process':
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    with executor as ex:
+        # Keep only a few blocks in flight so huge ranges don't queue
+        # millions of futures up front; results still arrive in order.
+        pending = deque()
+        try:
+            for lo, hi in blocks:
+                pending.append(
+                    ex.submit(_scan_block_task, lo, hi, prime_limit, store)
+                )
+                if len(pending) >= 2 * workers:
+                    yield from finished(pending.popleft().result())
+            while pending:
+                yield from finished(pending.popleft().result())
+        finally:
+            # Consumer stopped early: don't run blocks nobody will read
+            for future in pending:
+                future.cancel()
+
+
+def block_throughput(block):
+    """
+    Numbers scanned per second for a BlockResult.
+    """
+    return (block.hi - block.lo) / block.seconds if block.seconds else 0.0
+
+
+def block_records(block):
+    """
+    JSON-ready records for a BlockResult: one per candidate, then a
+    summary of the block with its throughput.
+    """
+    for n, reason in block.candidates:
+        yield {'type': 'candidate', 'n': n, 'reason': reason}
+    yield {
+        'type': 'block', 'lo': block.lo, 'hi': block.hi,
+        'candidates': len(block.candidates), 'seconds': block.seconds,
+        'numbers_per_second': block_throughput(block),
+    }
+
+
+def explore_odd(start, end, workers=4, block_size=DEFAULT_BLOCK_SIZE,
+                backend='thread', cache_dir=None):
+    """
+    Explore range for potential odd perfect number candidates.
+    The range is sieved in blocks of block_size numbers, so memory
+    stays bounded however large the range is.
+    backend selects how blocks are run: 'thread' (thread pool),
+    'process' (process pool, scales across cores) or 'serial'.
+    cache_dir keeps sieved blocks on disk (see FactorStore) so later runs
+    over overlapping ranges skip them. end may be at most MAX_END.
+    Returns list of (n, reason) for candidates, in ascending order.
+    Use iter_odd to stream results instead.
+    """
+    candidates = []
+    for block in iter_odd(start, end, workers=workers, block_size=block_size,
+                          backend=backend, cache_dir=cache_dir):
+        candidates.extend(block.candidates)
     return candidates
 
 
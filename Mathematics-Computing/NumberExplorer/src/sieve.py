@@ -0,0 +1,155 @@
+import os
+import tempfile
+from bisect import bisect_left
+from math import isqrt
+
+import numpy as np
+
+# Numbers per sieved block; bounds memory use regardless of range size.
+DEFAULT_BLOCK_SIZE = 1 << 18
+
+
+def primes_up_to(limit):
+    """
+    Return a NumPy array of all primes <= limit (sieve of Eratosthenes).
+    """
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, isqrt(limit) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    return np.flatnonzero(is_prime)
+
+
+def block_bounds(start, end, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Yield half-open (lo, hi) bounds covering [start, end].
+    Block edges are aligned to multiples of block_size so that
+    overlapping ranges split into the same blocks.
+    """
+    lo = start
+    while lo <= end:
+        hi = min((lo // block_size + 1) * block_size, end + 1)
+        yield lo, hi
+        lo = hi
+
+
+def smallest_prime_factors(lo, hi, primes):
+    """
+    Sieve the smallest prime factor of every integer in [lo, hi).
+    primes must contain every prime <= sqrt(hi - 1).
+    Entry i holds the smallest prime factor of lo + i, or 0 when
+    lo + i has no factor below its square root (it is prime).
+    """
+    if lo < 1:
+        raise ValueError('lo must be >= 1')
+    spf = np.zeros(hi - lo, dtype=np.uint32)
+    for p in primes:
+        p = int(p)
+        if p * p >= hi:
+            break
+        first = max(p * p, -(-lo // p) * p)
+        # Primes are visited in ascending order, so only unmarked
+        # entries take p as their smallest factor.
+        segment = spf[first - lo::p]
+        segment[segment == 0] = p
+    return spf
+
+
+def factorint_with_spf(n, smallest, primes):
+    """
+    Factor n given its sieved smallest prime factor (0 if n is prime).
+    primes must be an ascending list (not an array) of every prime <= sqrt(n).
+    Returns {prime: exponent} in ascending order, like sympy.factorint.
+    """
+    factors = {}
+    if smallest == 0:
+        if n > 1:
+            factors[n] = 1
+        return factors
+    m = n
+    for i in range(bisect_left(primes, smallest), len(primes)):
+        p = primes[i]
+        if p * p > m:
+            break
+        while m % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            m //= p
+    if m > 1:
+        factors[m] = factors.get(m, 0) + 1
+    return factors
+
+
+class FactorStore:
+    """
+    Persistent cache of smallest-prime-factor tables on disk.
+    Each aligned block of block_size numbers is sieved once, saved as a
+    .npy file under directory and memory-mapped on later reads, so
+    re-scanning or widening a range only sieves blocks not seen before.
+    """
+
+    def __init__(self, directory, block_size=DEFAULT_BLOCK_SIZE):
+        self.block_size = block_size
+        # Tables are only reusable for the same block layout
+        self.directory = os.path.join(directory, f'spf-{block_size}')
+        os.makedirs(self.directory, exist_ok=True)
+        # (limit, primes <= limit) kept as one tuple so threads sharing the
+        # store never see a limit paired with a shorter list
+        self._prime_table = (1, [])
+
+    def _primes_through(self, limit):
+        """
+        Ascending list of every prime <= limit, grown on demand.
+        """
+        known, primes = self._prime_table
+        if limit > known:
+            known = max(limit, 2 * known)
+            primes = primes_up_to(known).tolist()
+            self._prime_table = (known, primes)
+        return primes
+
+    def block(self, index):
+        """
+        Smallest-prime-factor table for [index * block_size, (index + 1) * block_size).
+        Loaded memory-mapped if cached, otherwise sieved and written to disk.
+        """
+        path = os.path.join(self.directory, f'{index}.npy')
+        if os.path.exists(path):
+            return np.load(path, mmap_mode='r')
+        base = index * self.block_size
+        hi = base + self.block_size
+        table = np.zeros(self.block_size, dtype=np.uint32)
+        lo = max(base, 1)
+        table[lo - base:] = smallest_prime_factors(
+            lo, hi, self._primes_through(isqrt(hi - 1))
+        )
+        # Composite factors stay below sqrt(hi), so most blocks fit in 16 bits
+        if isqrt(hi - 1) < 1 << 16:
+            table = table.astype(np.uint16)
+        # Write to a temporary file first so concurrent workers never
+        # read a half-written table
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, table)
+        os.replace(tmp_path, path)
+        return table
+
+    def smallest_prime_factors(self, lo, hi):
+        """
+        Same as the module-level smallest_prime_factors, but served from
+        the cache. [lo, hi) must not cross a block boundary.
+        """
+        index = lo // self.block_size
+        base = index * self.block_size
+        if hi - base > self.block_size:
+            raise ValueError('range crosses a block boundary')
+        return self.block(index)[lo - base:hi - base]
+
+    def factorint(self, n):
+        """
+        Factor n using its cached block. Returns {prime: exponent} like sympy.factorint.
+        """
+        smallest = int(self.block(n // self.block_size)[n % self.block_size])
+        return factorint_with_spf(n, smallest, self._primes_through(isqrt(n)))
@@ -20,3 +20,31 @@ def test_validate_perfect_true():
 def test_validate_perfect_false():
     assert validate_perfect(7) is False
     assert validate_perfect(1) is False
+
+
+def test_lucas_lehmer_matches_known_mersenne_exponents():
+    from src.even import is_mersenne_prime, prime_exponents
+    known = [2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607]
+    assert [p for p in prime_exponents(700) if is_mersenne_prime(p)] == known
+    assert is_mersenne_prime(4) is False
+
+
+def test_generate_perfect_beyond_31():
+    exponents = [p for p, _ in generate_perfect(130)]
+    assert exponents[-4:] == [61, 89, 107, 127]
+
+
+def test_validate_perfect_large_and_even_non_perfect():
+    perfects = generate_perfect(700)
+    assert all(validate_perfect(n) is True for _, n in perfects)
+    assert validate_perfect(perfects[-1][1] + 2) is False
+    assert validate_perfect(12) is False
+    assert validate_perfect(2) is False
+    assert validate_perfect(945) is False
+
+
+def test_validate_perfect_with_factors():
+    from src.even import sigma
+    assert sigma({2: 2, 7: 1}) == 56
+    assert validate_perfect(28, factors={2: 2, 7: 1}) is True
+    assert validate_perfect(945, factors={3: 3, 5: 1, 7: 1}) is False
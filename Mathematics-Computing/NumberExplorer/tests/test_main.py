@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+from src.main import BACKENDS, DEFAULT_BLOCK_SIZE, MAX_END, build_parser
+from src import odd, sieve
+
+MAIN = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+
+
+def test_cli_constants_mirror_modules():
+    assert BACKENDS == odd.BACKENDS
+    assert MAX_END == odd.MAX_END
+    assert DEFAULT_BLOCK_SIZE == sieve.DEFAULT_BLOCK_SIZE
+    args = build_parser().parse_args(['odd', '-s', '1', '-e', '10'])
+    assert args.block_size == sieve.DEFAULT_BLOCK_SIZE
+
+
+def test_help_skips_heavy_imports():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', MAIN, '--help'],
+        capture_output=True, text=True, check=True
+    )
+    imported = {line.split('|')[-1].strip() for line in result.stderr.splitlines()}
+    assert not imported & {'numpy', 'sympy', 'matplotlib'}
+
+
+def test_odd_rejects_end_beyond_limit():
+    result = subprocess.run(
+        [sys.executable, MAIN, 'odd', '-s', '1', '-e', str(MAX_END + 1)],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 1
+    assert 'end must be at most' in result.stderr
+
+
+def run_odd(*args):
+    return subprocess.run(
+        [sys.executable, MAIN, 'odd', '-s', '1', '-e', '5000', *args],
+        capture_output=True, text=True
+    )
+
+
+def test_odd_unwritable_jsonl(tmp_path):
+    result = run_odd('--jsonl', str(tmp_path / 'missing' / 'out.jsonl'))
+    assert result.returncode == 1
+    assert 'Cannot open JSONL file' in result.stderr
+    assert 'Traceback' not in result.stderr
+
+
+def test_odd_malformed_checkpoint(tmp_path):
+    checkpoint = tmp_path / 'scan.json'
+    checkpoint.write_text('{}')
+    result = run_odd('--checkpoint', str(checkpoint))
+    assert result.returncode == 1
+    assert 'not a scan checkpoint' in result.stderr
+    assert 'Traceback' not in result.stderr
+
+
+def test_odd_finished_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / 'scan.json')
+    assert run_odd('--checkpoint', checkpoint).returncode == 0
+    result = run_odd('--checkpoint', checkpoint)
+    assert result.returncode == 0
+    assert 'already complete' in result.stdout
+    assert 'No candidates found' not in result.stdout
@@ -1,6 +1,6 @@
 import pytest
 # Revert to direct import from src
-from src.odd import basic_conditions, prime_factor_filters, explore_odd
+from src.odd import MAX_END, basic_conditions, prime_factor_filters, explore_odd
 
 
 @ pytest.mark.parametrize("n,expected", [
@@ -29,3 +29,99 @@ def test_explore_odd_range():
     # Expect no results since prime_factor_filters is strict
     assert isinstance(results, list)
     assert all(isinstance(t, tuple) for t in results)
+
+
+def test_explore_odd_matches_per_number_filters():
+    # Around 1e9 real candidates exist (smallest prime factor >= 1e4)
+    start, end = 10**9, 10**9 + 20000
+    expected = [
+        n for n in range(start, end + 1)
+        if basic_conditions(n) and prime_factor_filters(n)
+    ]
+    results = explore_odd(start, end, workers=2, block_size=4096)
+    assert expected
+    assert [n for n, _ in results] == expected
+
+
+@pytest.mark.parametrize("backend", ["serial", "process"])
+def test_explore_odd_backends_agree(backend):
+    start, end = 10**9, 10**9 + 20000
+    expected = explore_odd(start, end, workers=2, block_size=4096)
+    assert explore_odd(start, end, workers=2, block_size=4096, backend=backend) == expected
+
+
+def test_explore_odd_unknown_backend():
+    with pytest.raises(ValueError):
+        explore_odd(1, 100, backend='gpu')
+
+
+@pytest.mark.parametrize("start,end", [(0, 100), (-50, 10), (-5, -1), (0, 1)])
+def test_explore_odd_non_positive_start(start, end):
+    assert explore_odd(start, end, backend='serial') == []
+
+
+def test_iter_odd_non_positive_start_checkpoint(tmp_path):
+    from src.odd import iter_odd, load_checkpoint
+
+    checkpoint = str(tmp_path / 'scan.json')
+    blocks = list(iter_odd(0, 10000, block_size=4096, backend='serial', checkpoint=checkpoint))
+    assert blocks[0].lo == 2 and blocks[-1].hi == 10001
+    assert load_checkpoint(checkpoint, 0, 10000, 4096) == 10001
+
+
+def test_explore_odd_end_limit():
+    with pytest.raises(ValueError):
+        explore_odd(MAX_END, MAX_END + 1)
+
+
+def test_basic_conditions_mask_matches_scalar():
+    import numpy as np
+    from src.odd import basic_conditions_block, basic_conditions_mask
+
+    for lo, hi in [(1, 3000), (147420 - 50, 147420 + 3000), (10**9, 10**9 + 3000)]:
+        expected = [basic_conditions(n) for n in range(lo, hi)]
+        assert basic_conditions_mask(np.arange(lo, hi)).tolist() == expected
+        assert basic_conditions_block(lo, hi).tolist() == expected
+
+
+@pytest.mark.parametrize("backend", ['serial', 'thread'])
+def test_explore_odd_with_cache_dir(tmp_path, backend):
+    start, end = 10**9, 10**9 + 20000
+    expected = explore_odd(start, end, workers=2, block_size=4096)
+    # Threads share one FactorStore and grow its prime list concurrently
+    cold = explore_odd(start, end, workers=8, block_size=4096, backend=backend, cache_dir=str(tmp_path))
+    warm = explore_odd(start, end, block_size=4096, backend='serial', cache_dir=str(tmp_path))
+    assert cold == warm == expected
+
+
+def test_iter_odd_resumes_from_checkpoint(tmp_path):
+    from src.odd import iter_odd
+
+    start, end = 10**9, 10**9 + 20000
+    expected = explore_odd(start, end, workers=2, block_size=4096)
+    checkpoint = str(tmp_path / 'scan.json')
+
+    # Stop after two blocks, as if the run had crashed
+    blocks = iter_odd(start, end, block_size=4096, backend='serial', checkpoint=checkpoint)
+    first = [next(blocks), next(blocks)]
+    next(blocks)  # resume the generator so the second block is checkpointed
+    blocks.close()
+
+    rest = list(iter_odd(start, end, block_size=4096, backend='serial', checkpoint=checkpoint))
+    assert rest[0].lo == first[-1].hi
+    resumed = [c for block in first + rest for c in block.candidates]
+    assert resumed == expected
+    assert list(iter_odd(start, end, block_size=4096, checkpoint=checkpoint)) == []
+
+    with pytest.raises(ValueError):
+        next(iter_odd(start, end + 1, block_size=4096, checkpoint=checkpoint))
+
+
+@pytest.mark.parametrize("content", ['{}', '[]', '{"start": 1, "end": 10, "block_size": 4096}'])
+def test_load_checkpoint_malformed(tmp_path, content):
+    from src.odd import load_checkpoint
+
+    checkpoint = tmp_path / 'scan.json'
+    checkpoint.write_text(content)
+    with pytest.raises(ValueError):
+        load_checkpoint(str(checkpoint), 1, 10, 4096)
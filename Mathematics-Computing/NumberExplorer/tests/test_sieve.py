@@ -0,0 +1,44 @@
+import pytest
+import sympy
+from src.sieve import (FactorStore, block_bounds, factorint_with_spf,
+                       primes_up_to, smallest_prime_factors)
+
+
+def test_primes_up_to():
+    assert primes_up_to(1).tolist() == []
+    assert primes_up_to(30).tolist() == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_block_bounds_aligned():
+    assert list(block_bounds(5, 25, block_size=10)) == [(5, 10), (10, 20), (20, 26)]
+    assert list(block_bounds(7, 7, block_size=10)) == [(7, 8)]
+
+
+@pytest.mark.parametrize("lo,hi", [(1, 500), (10**6, 10**6 + 500)])
+def test_sieve_factorizations_match_sympy(lo, hi):
+    primes = primes_up_to(1001).tolist()
+    spf = smallest_prime_factors(lo, hi, primes)
+    for offset, n in enumerate(range(lo, hi)):
+        factors = factorint_with_spf(n, int(spf[offset]), primes)
+        assert factors == sympy.factorint(n)
+        assert list(factors) == sorted(factors)
+
+
+def test_smallest_prime_factors_rejects_zero():
+    with pytest.raises(ValueError):
+        smallest_prime_factors(0, 10, [2, 3])
+
+
+def test_factor_store_persists_blocks(tmp_path):
+    store = FactorStore(str(tmp_path), block_size=1024)
+    for n in [2, 97, 1023, 1024, 5000, 10**6 + 3]:
+        assert store.factorint(n) == sympy.factorint(n)
+    cached = sorted(p.name for p in (tmp_path / 'spf-1024').iterdir())
+    assert cached == ['0.npy', '1.npy', '4.npy', '976.npy']
+
+    reopened = FactorStore(str(tmp_path), block_size=1024)
+    primes = primes_up_to(100).tolist()
+    expected = smallest_prime_factors(4100, 4200, primes)
+    assert reopened.smallest_prime_factors(4100, 4200).tolist() == expected.tolist()
+    with pytest.raises(ValueError):
+        reopened.smallest_prime_factors(1000, 1100)